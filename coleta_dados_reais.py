@@ -1,14 +1,35 @@
 import os
+import codecs
+import errno
 import json
 import logging
 import datetime
+import functools
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import time
-import hashlib
+import random
+import threading
+import unicodedata
+import zlib
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+import soupsieve
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,10 +37,459 @@ logging.basicConfig(
 )
 logger = logging.getLogger('coleta_dados_reais')
 
+# Timeouts das requisições (conexão curta; leitura próxima ao p95 observado) e parâmetros do circuit breaker
+TIMEOUT_CONEXAO = 3
+TIMEOUT_REQUISICAO = 8
+MAX_FALHAS_HOST = 3
+TEMPO_CIRCUITO_ABERTO = 60
+
+# Novas tentativas por requisição (feitas em _requisitar, passando pelo limite de taxa e
+# pelo circuit breaker a cada tentativa), status que as disparam e fator do backoff exponencial
+MAX_NOVAS_TENTATIVAS = 3
+STATUS_NOVA_TENTATIVA = frozenset((429, 500, 502, 503, 504))
+FATOR_BACKOFF = 0.5
+
+# Validade (em segundos) do cache de jogos por data
+TTL_CACHE_HOJE = 10 * 60
+TTL_CACHE_FUTURO = 60 * 60
+TTL_CACHE_PASSADO = 24 * 60 * 60
+
+# Caracteres removidos na normalização de nomes de times
+_NAO_ALFANUMERICO_RE = re.compile(r'[^a-z0-9]')
+
+# Tabela de conversão para minúsculas usada com translate() nas buscas XPath
+_MAIUSCULAS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑ'
+_MINUSCULAS = 'abcdefghijklmnopqrstuvwxyzáàâãäéèêëíìîïóòôõöúùûüçñ'
+
+# ID do jogo em URLs do FlashScore (formato típico: /jogo/ABCDEF/)
+_ID_FLASHSCORE_RE = re.compile(r'/jogo/([^/]+)')
+
+# Charset declarado no Content-Type e, no início da página, em <meta> ou na declaração XML
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_CHARSET_DECLARADO_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)|<\?xml[^>]+encoding=["\']([\w.:-]+)', re.IGNORECASE)
+
+# Erros de os.link em sistemas de arquivos sem hard links (overlays de contêiner, FAT)
+_ERROS_SEM_HARD_LINK = frozenset(
+    getattr(errno, nome) for nome in ('EPERM', 'ENOTSUP', 'EOPNOTSUPP', 'ENOSYS', 'EXDEV', 'EMLINK')
+    if hasattr(errno, nome)
+)
+
+# Tamanho máximo do corpo de uma resposta (páginas maiores são descartadas)
+TAMANHO_MAXIMO_RESPOSTA = 4 * 1024 * 1024
+
+class HostIndisponivelError(Exception):
+    """Indica que o host está com o circuito aberto após falhas consecutivas."""
+
+def _texto_elemento(elem) -> str:
+    """
+    Retorna o texto de um elemento sem espaços nas bordas.
+
+    Percorre a subárvore do elemento uma única vez; retorna string vazia se o elemento for None.
+    """
+    if elem is None:
+        return ''
+    return elem.get_text().strip()
+
+def _compilar_css_lxml(seletor: str) -> etree.XPath:
+    """
+    Compila um seletor CSS para um XPath do lxml que, como o soupsieve, só considera
+    os descendentes do elemento (e não o próprio elemento).
+
+    Args:
+        seletor: Seletor CSS (pode ter vários seletores separados por vírgula).
+
+    Returns:
+        XPath compilado; chamar com um elemento devolve a lista de elementos encontrados.
+    """
+    return etree.XPath(HTMLTranslator().css_to_xpath(seletor, prefix='descendant::'))
+
+def _arvore_html(response: requests.Response):
+    """
+    Parseia uma página HTML com lxml a partir dos bytes da resposta.
+
+    O charset vem do Content-Type ou, sem ele, do declarado no início da página (<meta
+    charset> ou declaração XML). Só quando nada declara um charset conhecido a página é
+    lida como UTF-8, já que o padrão do lxml nesse caso é Latin-1, o que corromperia acentos.
+
+    Args:
+        response: Resposta HTTP com o HTML.
+
+    Returns:
+        Elemento raiz do documento.
+    """
+    conteudo = response.content
+    candidatos = []
+    cabecalho = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    if cabecalho:
+        candidatos.append(cabecalho.group(1))
+    declarado = _CHARSET_DECLARADO_RE.search(conteudo, 0, 2048)
+    if declarado:
+        candidatos.append((declarado.group(1) or declarado.group(2)).decode('ascii'))
+
+    codificacao = 'utf-8'
+    for candidato in candidatos:
+        try:
+            codecs.lookup(candidato)
+        except LookupError:
+            continue
+        codificacao = candidato
+        break
+    return lxml.html.document_fromstring(conteudo, parser=lxml.html.HTMLParser(encoding=codificacao))
+
+def _primeiro(seletor: etree.XPath, elem) -> Optional[Any]:
+    """Retorna o primeiro elemento lxml encontrado pelo seletor, ou None."""
+    encontrados = seletor(elem)
+    return encontrados[0] if encontrados else None
+
+def _texto_lxml(elem) -> str:
+    """Equivalente a _texto_elemento para elementos lxml."""
+    if elem is None:
+        return ''
+    return elem.text_content().strip()
+
+def _primeiro_texto(seletores, elem) -> str:
+    """
+    Retorna o texto do primeiro elemento com texto não vazio, tentando os seletores em ordem.
+
+    Os seletores são tentados um a um, e não como um único seletor agrupado: um grupo
+    devolve os elementos na ordem do documento, e um ancestral que casasse com um seletor
+    genérico passaria na frente de um seletor específico listado antes.
+
+    Args:
+        seletores: Seletores soupsieve pré-compilados, em ordem de prioridade.
+        elem: Elemento onde buscar.
+
+    Returns:
+        Texto encontrado, ou string vazia.
+    """
+    for seletor in seletores:
+        texto = _texto_elemento(seletor.select_one(elem))
+        if texto:
+            return texto
+    return ''
+
+def _converter_data(data: Union[str, datetime.datetime]) -> Tuple[datetime.datetime, str]:
+    """
+    Aceita a data como datetime ou como string DD/MM/YYYY e retorna as duas formas.
+
+    Args:
+        data: Data como datetime ou string no formato DD/MM/YYYY.
+
+    Returns:
+        Tupla (datetime, string DD/MM/YYYY).
+    """
+    if isinstance(data, datetime.datetime):
+        return data, data.strftime('%d/%m/%Y')
+    return datetime.datetime.strptime(data, '%d/%m/%Y'), data
+
+def _serializar_json(dados: Any) -> bytes:
+    """
+    Serializa dados em JSON indentado (UTF-8), usando orjson quando disponível.
+
+    Args:
+        dados: Objeto a serializar.
+
+    Returns:
+        JSON codificado em UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(dados, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(dados, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _carregar_json(conteudo: bytes) -> Any:
+    """
+    Desserializa JSON, usando orjson quando disponível.
+
+    Args:
+        conteudo: JSON em bytes.
+
+    Returns:
+        Objeto desserializado.
+    """
+    if orjson is not None:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo)
+
+def _gravar_atomico(caminho: str, conteudo: bytes, substituir: bool = True) -> bool:
+    """
+    Grava bytes de forma atômica: o conteúdo vai para um arquivo temporário no mesmo
+    diretório, que só então assume o nome final. Leitores nunca veem um arquivo pela
+    metade, nem após uma queda no meio da gravação.
+
+    O temporário é criado com o modo padrão de open() (0o666 menos a umask), e não com
+    o 0o600 do mkstemp, para que o arquivo final tenha as mesmas permissões de antes.
+
+    Sem substituir, a criação exclusiva usa um hard link. Em sistemas de arquivos sem
+    suporte a hard links, cai para os.replace após verificar que o destino não existe
+    (exclusividade apenas aproximada).
+
+    Args:
+        caminho: Caminho final do arquivo.
+        conteudo: Bytes a gravar.
+        substituir: Se False, não sobrescreve um arquivo existente.
+
+    Returns:
+        True se o arquivo foi gravado; False se substituir for False e o arquivo já existir.
+    """
+    temporario = f"{caminho}.{os.urandom(8).hex()}.tmp"
+    fd = os.open(temporario, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        if substituir:
+            os.replace(temporario, caminho)
+            return True
+        try:
+            # link falha se o destino já existir, mantendo a criação exclusiva
+            os.link(temporario, caminho)
+        except FileExistsError:
+            return False
+        except OSError as e:
+            if e.errno not in _ERROS_SEM_HARD_LINK:
+                raise
+            if os.path.exists(caminho):
+                return False
+            os.replace(temporario, caminho)
+        return True
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+def _gravar_json_atomico(caminho: str, dados: Any, substituir: bool = True) -> bool:
+    """
+    Grava dados em JSON de forma atômica (ver _gravar_atomico).
+
+    Args:
+        caminho: Caminho final do arquivo.
+        dados: Objeto a serializar.
+        substituir: Se False, não sobrescreve um arquivo existente.
+
+    Returns:
+        True se o arquivo foi gravado; False se substituir for False e o arquivo já existir.
+    """
+    return _gravar_atomico(caminho, _serializar_json(dados), substituir)
+
+class LimitadorTaxa:
+    """
+    Token bucket thread-safe para limitar a taxa de requisições a um host.
+    """
+    def __init__(self, requisicoes: float, periodo: float = 1.0):
+        """
+        Inicializa o limitador.
+
+        Args:
+            requisicoes: Número máximo de requisições por período.
+            periodo: Duração do período em segundos.
+        """
+        self.capacidade = requisicoes
+        self.taxa = requisicoes / periodo
+        self.tokens = requisicoes
+        self.ultima_atualizacao = time.monotonic()
+        self._lock = threading.Lock()
+
+    def aguardar(self) -> None:
+        """Bloqueia até que haja um token disponível e o consome."""
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self.tokens = min(self.capacidade, self.tokens + (agora - self.ultima_atualizacao) * self.taxa)
+                self.ultima_atualizacao = agora
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                espera = (1 - self.tokens) / self.taxa
+            time.sleep(espera)
+
 class ColetorDadosReais:
     """
     Classe para coletar dados reais de jogos e estatísticas.
     """
+    # Padrão de horário (HH:MM) usado na extração genérica
+    _HORA_RE = re.compile(r'\d{1,2}:\d{2}')
+
+    # Seletores CSS pré-compilados (soupsieve) usados na extração de jogos
+    SELETORES_FS_JOGOS = [soupsieve.compile(seletor) for seletor in (
+        '.eventRow',                        # Novo seletor 2025
+        '.event__match',                    # Seletor antigo
+        '.sportName.soccer',                # Outro seletor possível
+        '.event__game',                     # Outro seletor possível
+        '.event__match--scheduled',         # Jogos agendados
+        '.event__match--live',              # Jogos ao vivo
+        '.leagues--static .event__match',   # Seletor específico para ligas
+        # Seletores com curinga (mais caros) ficam por último
+        'div[id*="g_1"]',                   # Seletor por ID de jogo
+        'div[class*="event"][class*="match"]',  # Seletor genérico
+        'div[class*="match"]',              # Seletor mais genérico
+        'div[class*="event"]',              # Seletor ainda mais genérico
+    )]
+    SELETORES_FS_CASA = tuple(soupsieve.compile(seletor) for seletor in (
+        '.event__participant--home',
+        '.teamName--home',
+        '[class*="home"]',
+        '.event__participant.event__participant--home',
+        '.eventTableTeam--home',
+        '.teamName',
+        'div[class*="participant"][class*="home"]',
+    ))
+    SELETORES_FS_VISITANTE = tuple(soupsieve.compile(seletor) for seletor in (
+        '.event__participant--away',
+        '.teamName--away',
+        '[class*="away"]',
+        '.event__participant.event__participant--away',
+        '.eventTableTeam--away',
+        'div[class*="participant"][class*="away"]',
+    ))
+    SELETORES_FS_HORA = tuple(soupsieve.compile(seletor) for seletor in (
+        '.event__time',
+        '.matchTime',
+        '[class*="time"]',
+        '.event__time.event__time--scheduled',
+        '.eventTime',
+        'div[class*="startTime"]',
+    ))
+    SELETORES_FS_CAMPEONATO = tuple(soupsieve.compile(seletor) for seletor in (
+        '.event__title',
+        '.tournament',
+        '[class*="league"]',
+        '[class*="tournament"]',
+        '.event__title--type',
+        '.eventLeague',
+        'span[class*="category"]',
+    ))
+    SELETORES_ACADEMIA_JOGOS = [soupsieve.compile(seletor) for seletor in (
+        '.match-row',                       # Novo seletor 2025
+        '.game-row',                        # Outro seletor possível
+        '.match',                           # Outro seletor possível
+        'tr[data-game-id]',                 # Jogos por ID
+        # Seletores com curinga (mais caros) ficam por último
+        'div[class*="match"]',              # Seletor genérico
+        'div[class*="game"]',               # Seletor genérico
+        'tr[class*="match"]',               # Seletor para tabela
+        'tr[class*="game"]',                # Seletor para tabela
+    )]
+    SELETORES_ACADEMIA_CASA = tuple(soupsieve.compile(seletor) for seletor in (
+        '.home-team',
+        '.team-home',
+        '[class*="home"]',
+        '.home',
+        'td:nth-child(2)',
+        'div[class*="team"][class*="home"]',
+    ))
+    SELETORES_ACADEMIA_VISITANTE = tuple(soupsieve.compile(seletor) for seletor in (
+        '.away-team',
+        '.team-away',
+        '[class*="away"]',
+        '.away',
+        'td:nth-child(4)',
+        'div[class*="team"][class*="away"]',
+    ))
+    SELETORES_ACADEMIA_HORA = tuple(soupsieve.compile(seletor) for seletor in (
+        '.match-time',
+        '.time',
+        '[class*="time"]',
+        '.hour',
+        'td:nth-child(1)',
+        'div[class*="time"]',
+    ))
+    SELETORES_ACADEMIA_CAMPEONATO = tuple(soupsieve.compile(seletor) for seletor in (
+        '.league-name',
+        '.competition',
+        '[class*="league"]',
+        '[class*="competition"]',
+        '.tournament',
+        'div[class*="league"]',
+    ))
+    SELETORES_SOFASCORE_JOGOS = [soupsieve.compile(seletor) for seletor in (
+        '.sc-fqkvVR',                       # Seletor 2025
+        '.event-list__item',                # Outro seletor possível
+        '.event__match',                    # Outro seletor possível
+        'div[data-event-id]',               # Seletor por ID de evento
+        # Seletores com curinga (mais caros) ficam por último
+        'div[class*="event"]',              # Seletor genérico
+        'div[class*="match"]',              # Seletor genérico
+    )]
+    SELETOR_SOFASCORE_TIMES = soupsieve.compile(
+        '.sc-dcJsrY, .event__participant, .event__team, [class*="team"], [class*="participant"]'
+    )
+    SELETORES_SOFASCORE_HORA = tuple(soupsieve.compile(seletor) for seletor in (
+        '.sc-kAyceB',
+        '.event__time',
+        '.event__startTime',
+        '[class*="time"]',
+        'span[class*="hour"]',
+    ))
+    SELETORES_SOFASCORE_CAMPEONATO = tuple(soupsieve.compile(seletor) for seletor in (
+        '.sc-gFqAkR',
+        '.event__title',
+        '.event__tournament',
+        '[class*="tournament"]',
+        '[class*="league"]',
+        'span[class*="category"]',
+    ))
+
+    # Seletores usados na extração de estatísticas: a busca da Academia usa soupsieve; o resto
+    # são XPath do lxml, que dispensam a árvore do BeautifulSoup
+    # Primeiro resultado da busca do FlashScore cujo texto contém os dois times (sem diferenciar
+    # maiúsculas); os nomes são passados como variáveis XPath, sem interpolar na expressão
+    BUSCA_FS_JOGO = etree.XPath(
+        '(' + HTMLTranslator().css_to_xpath(
+            '.event__match, [class*="event"], [class*="match"], a[href*="/jogo/"], div[id*="g_1"]',
+            prefix='descendant::'
+        ) + ')'
+        '[contains(translate(string(.), $maiusculas, $minusculas), $casa)]'
+        '[contains(translate(string(.), $maiusculas, $minusculas), $visitante)][1]'
+    )
+    SELETOR_FS_STATS_CATEGORIAS = _compilar_css_lxml('.statCategory, [class*="statistic"], [class*="stat"], [class*="category"], div[class*="stats"]')
+    SELETOR_FS_STATS_TITULO = _compilar_css_lxml('.statCategoryName, [class*="categoryName"], [class*="title"], [class*="header"]')
+    SELETOR_FS_STATS_LINHAS = _compilar_css_lxml('.statRow, [class*="statRow"], [class*="row"], [class*="item"], div[class*="stat"]')
+    SELETOR_FS_STATS_NOME = _compilar_css_lxml('.statName, [class*="statName"], [class*="name"], [class*="label"]')
+    SELETOR_FS_STATS_CASA = _compilar_css_lxml('.statHome, [class*="home"], [class*="team1"], [class*="left"]')
+    SELETOR_FS_STATS_VISITANTE = _compilar_css_lxml('.statAway, [class*="away"], [class*="team2"], [class*="right"]')
+    SELETOR_ACADEMIA_STATS_LINKS = soupsieve.compile('a[href*="/stats/"], a[href*="/match/"], a[href*="/game/"], .match-row a, .game-row a')
+    SELETOR_ACADEMIA_STATS_CATEGORIAS = _compilar_css_lxml('.stats-section, .stats-category, [class*="stats"], [class*="statistics"]')
+    SELETOR_ACADEMIA_STATS_TITULO = _compilar_css_lxml('h2, h3, .section-title, .category-title, [class*="title"]')
+    SELETOR_ACADEMIA_STATS_LINHAS = _compilar_css_lxml('.stats-row, .stat-item, tr[class*="stat"], [class*="stat-row"]')
+    SELETOR_ACADEMIA_STATS_NOME = _compilar_css_lxml('.stat-name, .stat-label, td:nth-child(2), [class*="name"], [class*="label"]')
+    SELETOR_ACADEMIA_STATS_CASA = _compilar_css_lxml('.home-value, .team1-value, td:nth-child(1), [class*="home"], [class*="team1"]')
+    SELETOR_ACADEMIA_STATS_VISITANTE = _compilar_css_lxml('.away-value, .team2-value, td:nth-child(3), [class*="away"], [class*="team2"]')
+    SELETOR_ACADEMIA_STATS_TABELAS = _compilar_css_lxml('table, .stats-table, [class*="stats-table"]')
+    SELETOR_LINHAS_TABELA = _compilar_css_lxml('tr')
+    SELETOR_CELULAS_TABELA = _compilar_css_lxml('td, th')
+    TITULO_TABELA = etree.XPath('preceding::*[self::h2 or self::h3 or self::h4][1]')
+
+    # Configuração de extração por fonte: seletores de jogos e de cada campo, e onde mais
+    # procurar o campeonato quando ele não está dentro do elemento do jogo
+    FONTES_HTML = {
+        'FlashScore': {
+            'jogos': SELETORES_FS_JOGOS,
+            'casa': SELETORES_FS_CASA,
+            'visitante': SELETORES_FS_VISITANTE,
+            'hora': SELETORES_FS_HORA,
+            'campeonato': SELETORES_FS_CAMPEONATO,
+            'campeonato_nos_pais': True,
+            'cabecalhos': None,
+        },
+        'Academia das Apostas': {
+            'jogos': SELETORES_ACADEMIA_JOGOS,
+            'casa': SELETORES_ACADEMIA_CASA,
+            'visitante': SELETORES_ACADEMIA_VISITANTE,
+            'hora': SELETORES_ACADEMIA_HORA,
+            'campeonato': SELETORES_ACADEMIA_CAMPEONATO,
+            'campeonato_nos_pais': True,
+            'cabecalhos': ['h2', 'h3', 'h4', 'div.league-header'],
+        },
+        'SofaScore': {
+            'jogos': SELETORES_SOFASCORE_JOGOS,
+            'times': SELETOR_SOFASCORE_TIMES,
+            'hora': SELETORES_SOFASCORE_HORA,
+            'campeonato': SELETORES_SOFASCORE_CAMPEONATO,
+            'campeonato_nos_pais': False,
+            'cabecalhos': ['h2', 'h3', 'h4', 'div[class*="header"]'],
+        },
+    }
+
     def __init__(self, diretorio_dados: str = None):
         """
         Inicializa o coletor de dados reais.
@@ -36,9 +506,17 @@ class ColetorDadosReais:
         self.diretorio_jogos = os.path.join(self.diretorio_dados, 'jogos')
         self.diretorio_estatisticas = os.path.join(self.diretorio_dados, 'estatisticas')
         self.diretorio_debug = os.path.join(self.diretorio_dados, 'debug')
+        self.diretorio_cache = os.path.join(self.diretorio_dados, 'cache')
+        self.diretorio_cache_html = os.path.join(self.diretorio_cache, 'html')
         os.makedirs(self.diretorio_jogos, exist_ok=True)
         os.makedirs(self.diretorio_estatisticas, exist_ok=True)
         os.makedirs(self.diretorio_debug, exist_ok=True)
+        os.makedirs(self.diretorio_cache_html, exist_ok=True)
+        self._limpar_cache_html()
+
+        # Dumps de HTML para debug só são gravados com COLETOR_DEBUG=1, em uma thread separada
+        self.debug = bool(int(os.environ.get('COLETOR_DEBUG', '0')))
+        self._debug_exec = ThreadPoolExecutor(max_workers=1)
 
         # User agents atualizados para 2025
         self.user_agents = [
@@ -49,10 +527,240 @@ class ColetorDadosReais:
             'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1'
         ]
 
+        # Sessão HTTP persistente (keep-alive + pool de conexões) compartilhada por todas as coletas
+        self.session = requests.Session()
+        # Sem retries no adapter: eles ignorariam o limite de taxa e o circuit breaker, então
+        # as novas tentativas são feitas por _requisitar
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Referer': 'https://www.google.com/',
+            'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
+            'sec-ch-ua-mobile': '?0',
+            'sec-ch-ua-platform': '"Windows"',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'cross-site',
+            'Sec-Fetch-User': '?1',
+            'Upgrade-Insecure-Requests': '1',
+            'Connection': 'keep-alive',
+            'Cache-Control': 'max-age=0',
+            'dnt': '1'
+        })
+
+        # Limites de requisições por host (token bucket) para evitar throttling
+        self._limites = {
+            'www.flashscore.com.br': LimitadorTaxa(8, 1),
+            'www.academiadasapostas.com': LimitadorTaxa(4, 1),
+            'www.sofascore.com': LimitadorTaxa(4, 1),
+            'api.sofascore.com': LimitadorTaxa(4, 1)
+        }
+
+        # Limite de conexões simultâneas por host (vários dias são coletados em paralelo)
+        self._conexoes_por_host = {host: threading.BoundedSemaphore(8) for host in self._limites}
+
+        # Circuit breaker por host: após falhas consecutivas, o host é ignorado por um tempo
+        self._host_failures: Dict[str, int] = {}
+        self._host_open_until: Dict[str, float] = {}
+        self._circuito_lock = threading.Lock()
+
     def _get_random_user_agent(self):
         """Retorna um user agent aleatório da lista"""
         return self.user_agents[int(time.time()) % len(self.user_agents)]
 
+    def _escrever_debug(self, caminho: str, conteudo: bytes) -> None:
+        """
+        Grava um dump de HTML para debug (executado na thread de debug).
+
+        Args:
+            caminho: Caminho do arquivo de debug.
+            conteudo: Conteúdo bruto da resposta.
+        """
+        try:
+            with open(caminho, 'wb') as f:
+                f.write(conteudo)
+            logger.info(f"HTML salvo para debug em {caminho}")
+        except Exception as e:
+            logger.error(f"Erro ao salvar HTML de debug em {caminho}: {str(e)}")
+
+    def _requisitar(self, url: str, headers: Dict[str, str],
+                    tipos_aceitos: Tuple[str, ...] = ('text/html',)) -> requests.Response:
+        """
+        Faz uma requisição GET respeitando o limite de taxa e o circuit breaker do host.
+
+        A resposta é lida em streaming: o corpo só é baixado se o status for 200 e o
+        Content-Type for um dos aceitos, e é descartado se passar de TAMANHO_MAXIMO_RESPOSTA.
+        Nos demais casos a resposta é devolvida com corpo vazio.
+
+        Erros de conexão e os status de STATUS_NOVA_TENTATIVA são tentados de novo até
+        MAX_NOVAS_TENTATIVAS vezes, com backoff exponencial (ou o Retry-After do
+        servidor). Cada tentativa consome um token do limite de taxa e é registrada no
+        circuit breaker.
+
+        Args:
+            url: URL a ser acessada.
+            headers: Cabeçalhos da requisição.
+            tipos_aceitos: Prefixos de Content-Type cujo corpo deve ser lido.
+
+        Returns:
+            Resposta HTTP (já fechada, com o corpo em memória).
+
+        Raises:
+            HostIndisponivelError: Se o host estiver com o circuito aberto.
+        """
+        host = urlparse(url).hostname
+        espera = 0
+        for tentativa in range(MAX_NOVAS_TENTATIVAS + 1):
+            ultima = tentativa == MAX_NOVAS_TENTATIVAS
+            if tentativa:
+                time.sleep(espera)
+
+            with self._circuito_lock:
+                aberto_ate = self._host_open_until.get(host, 0)
+            if time.monotonic() < aberto_ate:
+                raise HostIndisponivelError(f"Host {host} temporariamente ignorado após falhas consecutivas")
+
+            limite = self._limites.get(host)
+            if limite:
+                limite.aguardar()
+
+            # Jitter para não sincronizar rajadas de requisições
+            time.sleep(random.uniform(0, 0.3))
+
+            espera = FATOR_BACKOFF * 2 ** tentativa
+            try:
+                with self._conexoes_por_host.get(host) or nullcontext():
+                    response = self.session.get(url, headers=headers, timeout=(TIMEOUT_CONEXAO, TIMEOUT_REQUISICAO), stream=True)
+                    try:
+                        response._content = self._ler_corpo(response, tipos_aceitos)
+                    finally:
+                        response.close()
+            except requests.RequestException:
+                self._registrar_resultado_host(host, sucesso=False)
+                if ultima:
+                    raise
+                continue
+
+            falhou = response.status_code in (403, 429) or response.status_code >= 500
+            self._registrar_resultado_host(host, sucesso=not falhou)
+            if ultima or response.status_code not in STATUS_NOVA_TENTATIVA:
+                return response
+
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                espera = min(int(retry_after), TEMPO_CIRCUITO_ABERTO)
+            logger.warning(f"{url} respondeu {response.status_code}; nova tentativa em {espera}s")
+
+    def _requisitar_com_cache(self, url: str, headers: Dict[str, str], espera: float = 0) -> requests.Response:
+        """
+        Faz uma requisição GET reaproveitando o HTML já baixado no mesmo dia.
+
+        As páginas são guardadas em disco, junto com o Content-Type, com uma chave derivada
+        da URL e prefixada pela data de hoje, então execuções repetidas ao longo do dia não
+        voltam à rede. Só respostas 200 com corpo são guardadas.
+
+        Args:
+            url: URL a ser acessada.
+            headers: Cabeçalhos da requisição.
+            espera: Pausa (em segundos) antes de ir à rede; não se aplica a páginas em cache.
+
+        Returns:
+            Resposta HTTP (do cache ou da rede).
+        """
+        chave = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        caminho = os.path.join(self.diretorio_cache_html, f"{datetime.date.today()}_{chave}.cache")
+        try:
+            with open(caminho, 'rb') as f:
+                tipo, _, conteudo = f.read().partition(b'\n')
+        except OSError:
+            pass
+        else:
+            response = requests.Response()
+            response.status_code = 200
+            response.url = url
+            response._content = conteudo
+            if tipo:
+                response.headers['Content-Type'] = tipo.decode('latin-1')
+                response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            return response
+
+        if espera:
+            time.sleep(espera)
+        response = self._requisitar(url, headers)
+        if response.status_code == 200 and response.content:
+            tipo = response.headers.get('Content-Type', '')
+            try:
+                _gravar_atomico(caminho, tipo.encode('latin-1') + b'\n' + response.content)
+            except (OSError, UnicodeEncodeError) as e:
+                logger.warning(f"Não foi possível gravar cache de {url}: {str(e)}")
+        return response
+
+    def _limpar_cache_html(self) -> None:
+        """Remove as páginas em cache de dias anteriores."""
+        prefixo = f"{datetime.date.today()}_"
+        try:
+            nomes = os.listdir(self.diretorio_cache_html)
+        except OSError:
+            return
+        for nome in nomes:
+            if not nome.startswith(prefixo):
+                try:
+                    os.remove(os.path.join(self.diretorio_cache_html, nome))
+                except OSError:
+                    pass
+
+    def _ler_corpo(self, response: requests.Response, tipos_aceitos: Tuple[str, ...]) -> bytes:
+        """
+        Lê o corpo de uma resposta em streaming, abandonando-o cedo quando não interessa.
+
+        Args:
+            response: Resposta aberta com stream=True.
+            tipos_aceitos: Prefixos de Content-Type cujo corpo deve ser lido.
+
+        Returns:
+            Corpo da resposta, ou bytes vazios se o status/tipo não servir ou o limite de tamanho for excedido.
+        """
+        if response.status_code != 200:
+            return b''
+
+        tipo = response.headers.get('Content-Type', '')
+        if tipo and not tipo.startswith(tipos_aceitos):
+            logger.warning(f"Ignorando resposta de {response.url} com Content-Type {tipo}")
+            return b''
+
+        partes = []
+        tamanho = 0
+        for parte in response.iter_content(64 * 1024):
+            tamanho += len(parte)
+            if tamanho > TAMANHO_MAXIMO_RESPOSTA:
+                logger.warning(f"Resposta de {response.url} excede {TAMANHO_MAXIMO_RESPOSTA} bytes; descartando")
+                return b''
+            partes.append(parte)
+        return b''.join(partes)
+
+    def _registrar_resultado_host(self, host: str, sucesso: bool) -> None:
+        """
+        Atualiza o circuit breaker do host com o resultado de uma requisição.
+
+        Args:
+            host: Nome do host.
+            sucesso: Se a requisição foi bem-sucedida.
+        """
+        with self._circuito_lock:
+            if sucesso:
+                self._host_failures.pop(host, None)
+                return
+
+            falhas = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = falhas
+            if falhas >= MAX_FALHAS_HOST:
+                self._host_open_until[host] = time.monotonic() + TEMPO_CIRCUITO_ABERTO
+                self._host_failures[host] = 0
+                logger.warning(f"Host {host} falhou {falhas} vezes seguidas; ignorando por {TEMPO_CIRCUITO_ABERTO}s")
+
     def coletar_jogos_do_dia(self, data: Optional[str] = None, dias_futuros: int = 0) -> List[Dict[str, Any]]:
         """
         Coleta jogos do dia especificado e dos próximos dias.
@@ -81,41 +789,12 @@ class ColetorDadosReais:
         if (data_inicio - data_atual).days > 30:
             logger.warning(f"Data {data} está muito no futuro. Alguns sites podem não ter dados disponíveis.")
 
-        # Coletar jogos para cada dia
+        # Coletar jogos para cada dia; os dias são independentes, então são coletados em paralelo
+        datas = [data_inicio + datetime.timedelta(days=i) for i in range(dias_futuros + 1)]
         todos_jogos = []
-        for i in range(dias_futuros + 1):
-            data_atual = data_inicio + datetime.timedelta(days=i)
-            data_str = data_atual.strftime('%d/%m/%Y')
-
-            # Tentar diferentes fontes de dados
-            jogos_coletados = False
-            
-            # Tentar coletar jogos do FlashScore (prioridade 1)
-            jogos_flashscore = self._coletar_jogos_flashscore(data_str)
-            if jogos_flashscore:
-                todos_jogos.extend(jogos_flashscore)
-                jogos_coletados = True
-                logger.info(f"Coletados {len(jogos_flashscore)} jogos do FlashScore para a data {data_str}")
-            
-            # Se não conseguir, tentar coletar jogos da Academia das Apostas (prioridade 2)
-            if not jogos_coletados:
-                jogos_academia = self._coletar_jogos_academia_apostas(data_str)
-                if jogos_academia:
-                    todos_jogos.extend(jogos_academia)
-                    jogos_coletados = True
-                    logger.info(f"Coletados {len(jogos_academia)} jogos da Academia das Apostas para a data {data_str}")
-            
-            # Se não conseguir de nenhuma fonte, tentar coletar de fontes alternativas (prioridade 3)
-            if not jogos_coletados:
-                jogos_alternativa = self._coletar_jogos_fonte_alternativa(data_str)
-                if jogos_alternativa:
-                    todos_jogos.extend(jogos_alternativa)
-                    jogos_coletados = True
-                    logger.info(f"Coletados {len(jogos_alternativa)} jogos de fonte alternativa para a data {data_str}")
-            
-            # Se não conseguir de nenhuma fonte, registrar falha
-            if not jogos_coletados:
-                logger.error(f"Não foi possível coletar jogos para a data {data_str} de nenhuma fonte")
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(datas)))) as executor:
+            for jogos_dia in executor.map(self._coletar_dia, datas):
+                todos_jogos.extend(jogos_dia)
 
         # Se não conseguiu coletar nenhum jogo, lançar exceção
         if not todos_jogos:
@@ -129,20 +808,112 @@ class ColetorDadosReais:
 
         return todos_jogos
 
-    def _coletar_jogos_flashscore(self, data: str) -> List[Dict[str, Any]]:
+    def _coletar_dia(self, data_obj: datetime.datetime) -> List[Dict[str, Any]]:
+        """
+        Coleta os jogos de um único dia, tentando as fontes em ordem de prioridade.
+
+        Args:
+            data_obj: Data do dia a coletar.
+
+        Returns:
+            Lista de dicionários com informações dos jogos.
+        """
+        fontes = [
+            ('flashscore', self._coletar_jogos_flashscore, "do FlashScore"),
+            ('academia', self._coletar_jogos_academia_apostas, "da Academia das Apostas"),
+            ('alternativa', self._coletar_jogos_fonte_alternativa, "de fonte alternativa")
+        ]
+        
+        data_str = data_obj.strftime('%d/%m/%Y')
+        
+        # Tentar as fontes em ordem de prioridade, usando o cache em disco quando ainda válido
+        for fonte, coletar, descricao in fontes:
+            jogos = self._cache_get(fonte, data_obj)
+            if jogos is None:
+                jogos = coletar(data_obj)
+                if jogos:
+                    self._cache_put(fonte, data_obj, jogos)
+            if jogos:
+                logger.info(f"Coletados {len(jogos)} jogos {descricao} para a data {data_str}")
+                return jogos
+        
+        # Se não conseguir de nenhuma fonte, registrar falha
+        logger.error(f"Não foi possível coletar jogos para a data {data_str} de nenhuma fonte")
+        return []
+
+    def _caminho_cache(self, fonte: str, data_obj: datetime.datetime) -> str:
+        return os.path.join(self.diretorio_cache, f"{fonte}_{data_obj:%d%m%Y}.json")
+
+    def _cache_get(self, fonte: str, data_obj: datetime.datetime) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lê do cache em disco os jogos já coletados de uma fonte para uma data.
+
+        A validade depende da data: 10 minutos para hoje, 1 hora para datas futuras
+        e 24 horas para datas passadas.
+
+        Args:
+            fonte: Nome da fonte (flashscore, academia, alternativa).
+            data_obj: Data dos jogos.
+
+        Returns:
+            Lista de jogos em cache, ou None se não houver cache válido.
+        """
+        caminho = self._caminho_cache(fonte, data_obj)
+        try:
+            idade = time.time() - os.path.getmtime(caminho)
+        except OSError:
+            return None
+        
+        hoje = datetime.date.today()
+        dia = data_obj.date()
+        if dia == hoje:
+            ttl = TTL_CACHE_HOJE
+        elif dia > hoje:
+            ttl = TTL_CACHE_FUTURO
+        else:
+            ttl = TTL_CACHE_PASSADO
+        if idade > ttl:
+            return None
+        
+        try:
+            with open(caminho, 'rb') as f:
+                jogos = _carregar_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache inválido em {caminho}: {str(e)}")
+            return None
+        logger.info(f"Usando cache de {fonte} para a data {data_obj:%d/%m/%Y} ({len(jogos)} jogos)")
+        return jogos
+
+    def _cache_put(self, fonte: str, data_obj: datetime.datetime, jogos: List[Dict[str, Any]]) -> None:
+        """
+        Grava no cache em disco os jogos coletados de uma fonte para uma data.
+
+        Args:
+            fonte: Nome da fonte (flashscore, academia, alternativa).
+            data_obj: Data dos jogos.
+            jogos: Lista de jogos coletados.
+        """
+        caminho = self._caminho_cache(fonte, data_obj)
+        try:
+            _gravar_json_atomico(caminho, jogos)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar cache em {caminho}: {str(e)}")
+
+    def _coletar_jogos_flashscore(self, data: Union[str, datetime.datetime]) -> List[Dict[str, Any]]:
         """
         Coleta jogos do site FlashScore.
 
         Args:
-            data: Data no formato DD/MM/YYYY.
+            data: Data (datetime ou string no formato DD/MM/YYYY).
 
         Returns:
             Lista de dicionários com informações dos jogos.
         """
-        logger.info(f"Tentando coletar jogos do FlashScore para a data: {data}")
         try:
+            data_obj, data = _converter_data(data)
+            logger.info(f"Tentando coletar jogos do FlashScore para a data: {data}")
+            
             # Formatar data para o formato usado pelo FlashScore (YYYYMMDD)
-            data_obj = datetime.datetime.strptime(data, '%d/%m/%Y')
             data_formatada = data_obj.strftime('%Y%m%d')
             
             # URLs alternativas para tentar - atualizadas para 2025
@@ -153,47 +924,29 @@ class ColetorDadosReais:
                 f"https://www.flashscore.com.br/futebol/brasil/jogos/?date={data_formatada}"
             ]
             
-            # Cabeçalhos específicos para o FlashScore - atualizados para 2025
-            headers_flashscore = {
-                'User-Agent': self._get_random_user_agent(),
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Referer': 'https://www.google.com/',
-                'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'cross-site',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'dnt': '1'
-            }
+            # Cabeçalhos comuns ficam na sessão; apenas o User-Agent varia por requisição
+            headers_flashscore = {'User-Agent': self._get_random_user_agent()}
             
-            # Tentar cada URL
+            # Tentar as URLs em ordem de prioridade, parando na primeira que render jogos (os
+            # dias já são coletados em paralelo; disparar todas as URLs de uma vez multiplicaria
+            # a carga nos hosts)
             for url_index, url in enumerate(urls):
                 try:
                     logger.info(f"Tentando acessar URL: {url}")
                     
-                    # Adicionar delay para evitar bloqueio
-                    time.sleep(1 + url_index * 0.5)
-                    
-                    response = requests.get(url, headers=headers_flashscore, timeout=20)
+                    response = self._requisitar(url, headers_flashscore)
                     
                     # Salvar HTML para debug
-                    debug_file = os.path.join(self.diretorio_debug, f"flashscore_{data_formatada}_{url_index}.html")
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"HTML salvo para debug em {debug_file}")
+                    if self.debug:
+                        debug_file = os.path.join(self.diretorio_debug, f"flashscore_{data_formatada}_{url_index}.html")
+                        self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
                     
                     if response.status_code != 200:
                         logger.warning(f"Falha ao acessar FlashScore URL {url}: {response.status_code}")
                         continue
                     
                     # Parsear HTML
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Tentar diferentes seletores para encontrar jogos
                     jogos = self._extrair_jogos_flashscore(soup, data)
@@ -213,119 +966,68 @@ class ColetorDadosReais:
             logger.error(f"Erro ao coletar jogos do FlashScore: {str(e)}")
             return []
 
-    def _extrair_jogos_flashscore(self, soup: BeautifulSoup, data: str) -> List[Dict[str, Any]]:
+    def _extrair_jogos(self, soup: BeautifulSoup, fonte: str, data: str) -> List[Dict[str, Any]]:
         """
-        Extrai jogos do HTML do FlashScore usando diferentes seletores.
+        Extrai jogos do HTML de uma fonte usando os seletores configurados em FONTES_HTML.
 
         Args:
             soup: Objeto BeautifulSoup com o HTML da página.
+            fonte: Nome da fonte (chave de FONTES_HTML).
             data: Data no formato DD/MM/YYYY.
 
         Returns:
             Lista de dicionários com informações dos jogos.
         """
+        cfg = self.FONTES_HTML[fonte]
         jogos = []
         
-        # Lista de possíveis seletores para jogos - atualizados para 2025
-        seletores_jogos = [
-            '.eventRow',                      # Novo seletor 2025
-            '.event__match',                  # Seletor antigo
-            '.sportName.soccer',              # Outro seletor possível
-            '.event__game',                   # Outro seletor possível
-            '.event__match--scheduled',       # Jogos agendados
-            '.event__match--live',            # Jogos ao vivo
-            'div[class*="event"][class*="match"]',  # Seletor genérico
-            'div[class*="match"]',            # Seletor mais genérico
-            'div[class*="event"]',            # Seletor ainda mais genérico
-            '.leagues--static .event__match', # Seletor específico para ligas
-            'div[id*="g_1"]'                  # Seletor por ID de jogo
-        ]
-        
-        # Tentar cada seletor
-        for seletor in seletores_jogos:
-            elementos_jogo = soup.select(seletor)
-            logger.info(f"Seletor '{seletor}' encontrou {len(elementos_jogo)} elementos")
+        # Tentar cada seletor; os seletores com curinga só são tentados se nenhum seletor
+        # exato tiver encontrado elementos
+        encontrou_elementos = False
+        for seletor in cfg['jogos']:
+            if encontrou_elementos and '*=' in seletor.pattern:
+                break
+            
+            elementos_jogo = seletor.select(soup)
+            logger.info(f"Seletor '{seletor.pattern}' encontrou {len(elementos_jogo)} elementos")
             
             if not elementos_jogo:
                 continue
+            encontrou_elementos = True
             
             # Tentar extrair informações de cada elemento
             for elemento in elementos_jogo:
                 try:
-                    # Tentar diferentes seletores para times
-                    time_casa = None
-                    time_visitante = None
-                    hora = None
-                    campeonato = None
-                    
-                    # Seletores para time da casa - atualizados para 2025
-                    for seletor_casa in [
-                        '.event__participant--home', 
-                        '.teamName--home', 
-                        '[class*="home"]', 
-                        '.event__participant.event__participant--home',
-                        '.eventTableTeam--home',
-                        '.teamName',
-                        'div[class*="participant"][class*="home"]'
-                    ]:
-                        elem = elemento.select_one(seletor_casa)
-                        if elem and elem.text.strip():
-                            time_casa = elem.text.strip()
-                            break
-                    
-                    # Seletores para time visitante - atualizados para 2025
-                    for seletor_visitante in [
-                        '.event__participant--away', 
-                        '.teamName--away', 
-                        '[class*="away"]', 
-                        '.event__participant.event__participant--away',
-                        '.eventTableTeam--away',
-                        'div[class*="participant"][class*="away"]'
-                    ]:
-                        elem = elemento.select_one(seletor_visitante)
-                        if elem and elem.text.strip():
-                            time_visitante = elem.text.strip()
-                            break
+                    # Times: um seletor para cada lado, ou um seletor com os dois times em ordem
+                    if 'times' in cfg:
+                        time_casa = time_visitante = None
+                        times = cfg['times'].select(elemento, limit=2)
+                        if len(times) >= 2:
+                            time_casa = _texto_elemento(times[0])
+                            time_visitante = _texto_elemento(times[1])
+                    else:
+                        time_casa = _primeiro_texto(cfg['casa'], elemento)
+                        time_visitante = _primeiro_texto(cfg['visitante'], elemento)
                     
-                    # Seletores para hora - atualizados para 2025
-                    for seletor_hora in [
-                        '.event__time', 
-                        '.matchTime', 
-                        '[class*="time"]', 
-                        '.event__time.event__time--scheduled',
-                        '.eventTime',
-                        'div[class*="startTime"]'
-                    ]:
-                        elem = elemento.select_one(seletor_hora)
-                        if elem and elem.text.strip():
-                            hora = elem.text.strip()
-                            break
+                    hora = _primeiro_texto(cfg['hora'], elemento)
+                    campeonato = _primeiro_texto(cfg['campeonato'], elemento)
                     
-                    # Seletores para campeonato - atualizados para 2025
-                    for seletor_campeonato in [
-                        '.event__title', 
-                        '.tournament', 
-                        '[class*="league"]', 
-                        '[class*="tournament"]', 
-                        '.event__title--type',
-                        '.eventLeague',
-                        'span[class*="category"]'
-                    ]:
-                        elem = elemento.select_one(seletor_campeonato)
-                        if elem and elem.text.strip():
-                            campeonato = elem.text.strip()
-                            break
-                        
-                        # Se não encontrou no elemento, procurar nos elementos anteriores
+                    # Se não encontrou no elemento, procurar nos elementos anteriores
+                    if cfg['campeonato_nos_pais']:
                         parent = elemento.parent
                         while parent and not campeonato:
-                            elem = parent.select_one(seletor_campeonato)
-                            if elem and elem.text.strip():
-                                campeonato = elem.text.strip()
-                                break
+                            campeonato = _primeiro_texto(cfg['campeonato'], parent)
                             parent = parent.parent
                     
-                    # Se não encontrou campeonato, usar um valor padrão
+                    # Se não encontrou campeonato, procurar em cabeçalhos próximos
+                    if not campeonato and cfg['cabecalhos']:
+                        for header in elemento.find_all_previous(cfg['cabecalhos'], limit=3):
+                            texto = _texto_elemento(header)
+                            if texto:
+                                campeonato = texto
+                                break
+                    
+                    # Se ainda não encontrou campeonato, usar um valor padrão
                     if not campeonato:
                         campeonato = "Futebol"
                     
@@ -334,7 +1036,7 @@ class ColetorDadosReais:
                         # Se não encontrou hora, usar um valor padrão
                         if not hora:
                             hora = "00:00"
-                            
+                        
                         # Criar ID único para o jogo
                         id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, hora)
                         
@@ -346,95 +1048,169 @@ class ColetorDadosReais:
                             "data": data,
                             "hora": hora,
                             "campeonato": campeonato,
-                            "fonte": "FlashScore"
+                            "fonte": fonte
                         }
                         jogos.append(jogo)
                         logger.debug(f"Jogo extraído: {time_casa} vs {time_visitante}")
                 
                 except Exception as e:
-                    logger.error(f"Erro ao extrair informações do jogo: {str(e)}")
+                    logger.error(f"Erro ao extrair informações do jogo do {fonte}: {str(e)}")
             
             # Se encontrou jogos com este seletor, não precisa tentar os outros
             if jogos:
                 break
         
+        return jogos
+
+    def _extrair_jogos_genericos(self, soup: BeautifulSoup, tags: List[str], data: str, fonte: str) -> List[Dict[str, Any]]:
+        """
+        Extrai jogos procurando textos no formato "Time A vs Time B" nas tags indicadas.
+
+        Args:
+            soup: Objeto BeautifulSoup com o HTML da página.
+            tags: Nomes das tags a percorrer.
+            data: Data no formato DD/MM/YYYY.
+            fonte: Nome da fonte gravado nos jogos.
+
+        Returns:
+            Lista de dicionários com informações dos jogos.
+        """
+        jogos = []
+        
+        # Procurar por padrões de texto que possam indicar jogos, apenas em tags com um
+        # único texto direto (evita concatenar a subárvore inteira de cada contêiner)
+        for tag in soup.find_all(tags, string=True):
+            texto = tag.string.strip()
+            
+            # "Time A vs Time B" é um texto curto
+            if not texto or len(texto) > 80:
+                continue
+            
+            # Padrões comuns para jogos: "Time A vs Time B", "Time A x Time B", "Time A - Time B"
+            for separador in [' vs ', ' x ', ' - ', ' VS ', ' X ']:
+                if separador in texto:
+                    esquerda, _, direita = texto.partition(separador)
+                    if separador not in direita:
+                        time_casa = esquerda.strip()
+                        time_visitante = direita.strip()
+                        
+                        # Verificar se os nomes dos times parecem válidos (pelo menos 3 caracteres)
+                        if len(time_casa) >= 3 and len(time_visitante) >= 3:
+                            # Criar ID único para o jogo
+                            id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, "00:00")
+                            
+                            # Adicionar jogo à lista
+                            jogo = {
+                                "id_jogo": id_jogo,
+                                "time_casa": time_casa,
+                                "time_visitante": time_visitante,
+                                "data": data,
+                                "hora": "00:00",
+                                "campeonato": "Futebol",
+                                "fonte": fonte
+                            }
+                            jogos.append(jogo)
+        
+        return jogos
+
+    def _extrair_jogos_flashscore(self, soup: BeautifulSoup, data: str) -> List[Dict[str, Any]]:
+        """
+        Extrai jogos do HTML do FlashScore usando diferentes seletores.
+
+        Args:
+            soup: Objeto BeautifulSoup com o HTML da página.
+            data: Data no formato DD/MM/YYYY.
+
+        Returns:
+            Lista de dicionários com informações dos jogos.
+        """
+        jogos = self._extrair_jogos(soup, 'FlashScore', data)
+        
         # Se não encontrou jogos com os seletores específicos, tentar uma abordagem mais genérica
         if not jogos:
             logger.info("Tentando abordagem genérica para extrair jogos")
             
-            # Procurar por padrões de texto que possam indicar jogos
-            # Por exemplo, textos que contenham "vs", "x", "-" entre nomes de times
-            for tag in soup.find_all(['div', 'span', 'a']):
+            # Percorrer as tags uma única vez, em ordem de documento. Cada par de times fica
+            # pendente até surgir um horário entre as 5 tags div/span seguintes; o campeonato é
+            # o texto mais próximo entre as 10 tags div/span/h2/h3 anteriores.
+            candidatos = []
+            pendentes = []
+            anteriores = deque(maxlen=10)
+            for tag in soup.find_all(['div', 'span', 'a', 'h2', 'h3']):
                 texto = tag.get_text().strip()
                 
+                # Verificar se esta tag traz o horário de algum par pendente
+                if pendentes and tag.name in ('div', 'span'):
+                    e_hora = ':' in texto and self._HORA_RE.match(texto) is not None
+                    restantes = []
+                    for candidato, faltam in pendentes:
+                        if e_hora:
+                            candidato[3] = texto
+                        elif faltam > 1:
+                            restantes.append((candidato, faltam - 1))
+                    pendentes = restantes
+                
                 # Padrões comuns para jogos: "Time A vs Time B", "Time A x Time B", "Time A - Time B"
-                for separador in [' vs ', ' x ', ' - ', ' VS ', ' X ']:
-                    if separador in texto:
-                        partes = texto.split(separador)
-                        if len(partes) == 2:
-                            time_casa = partes[0].strip()
-                            time_visitante = partes[1].strip()
-                            
-                            # Verificar se os nomes dos times parecem válidos (pelo menos 3 caracteres)
-                            if len(time_casa) >= 3 and len(time_visitante) >= 3:
-                                # Tentar encontrar a hora próxima a este elemento
-                                hora = None
-                                for elem in tag.find_all_next(['div', 'span'], limit=5):
-                                    if ':' in elem.text:
-                                        hora_candidata = elem.text.strip()
-                                        # Verificar se parece uma hora (HH:MM)
-                                        if re.match(r'\d{1,2}:\d{2}', hora_candidata):
-                                            hora = hora_candidata
-                                            break
-                                
-                                # Se não encontrou hora, usar um valor padrão
-                                if not hora:
-                                    hora = "00:00"
-                                
-                                # Tentar encontrar o campeonato próximo a este elemento
-                                campeonato = None
-                                for elem in tag.find_all_previous(['div', 'span', 'h2', 'h3'], limit=10):
-                                    texto_elem = elem.text.strip()
-                                    # Verificar se parece um nome de campeonato
-                                    if len(texto_elem) > 3 and texto_elem not in [time_casa, time_visitante]:
-                                        campeonato = texto_elem
-                                        break
+                if tag.name in ('div', 'span', 'a') and len(texto) >= 7:
+                    for separador in [' vs ', ' x ', ' - ', ' VS ', ' X ']:
+                        if separador in texto:
+                            esquerda, _, direita = texto.partition(separador)
+                            if separador not in direita:
+                                time_casa = esquerda.strip()
+                                time_visitante = direita.strip()
                                 
-                                # Se não encontrou campeonato, usar um valor padrão
-                                if not campeonato:
-                                    campeonato = "Futebol"
-                                
-                                # Criar ID único para o jogo
-                                id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, hora)
-                                
-                                # Adicionar jogo à lista
-                                jogo = {
-                                    "id_jogo": id_jogo,
-                                    "time_casa": time_casa,
-                                    "time_visitante": time_visitante,
-                                    "data": data,
-                                    "hora": hora,
-                                    "campeonato": campeonato,
-                                    "fonte": "FlashScore (Genérico)"
-                                }
-                                jogos.append(jogo)
+                                # Verificar se os nomes dos times parecem válidos (pelo menos 3 caracteres)
+                                if len(time_casa) >= 3 and len(time_visitante) >= 3:
+                                    # Campeonato: texto anterior mais próximo que não seja um dos times
+                                    campeonato = next(
+                                        (t for t in reversed(anteriores) if len(t) > 3 and t not in (time_casa, time_visitante)),
+                                        "Futebol"
+                                    )
+                                    candidato = [time_casa, time_visitante, campeonato, None]
+                                    candidatos.append(candidato)
+                                    pendentes.append((candidato, 5))
+                
+                if tag.name != 'a':
+                    anteriores.append(texto)
+            
+            for time_casa, time_visitante, campeonato, hora in candidatos:
+                # Se não encontrou hora, usar um valor padrão
+                if not hora:
+                    hora = "00:00"
+                
+                # Criar ID único para o jogo
+                id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, hora)
+                
+                # Adicionar jogo à lista
+                jogo = {
+                    "id_jogo": id_jogo,
+                    "time_casa": time_casa,
+                    "time_visitante": time_visitante,
+                    "data": data,
+                    "hora": hora,
+                    "campeonato": campeonato,
+                    "fonte": "FlashScore (Genérico)"
+                }
+                jogos.append(jogo)
         
         return jogos
 
-    def _coletar_jogos_academia_apostas(self, data: str) -> List[Dict[str, Any]]:
+    def _coletar_jogos_academia_apostas(self, data: Union[str, datetime.datetime]) -> List[Dict[str, Any]]:
         """
         Coleta jogos do site Academia das Apostas.
 
         Args:
-            data: Data no formato DD/MM/YYYY.
+            data: Data (datetime ou string no formato DD/MM/YYYY).
 
         Returns:
             Lista de dicionários com informações dos jogos.
         """
-        logger.info(f"Tentando coletar jogos da Academia das Apostas para a data: {data}")
         try:
+            data_obj, data = _converter_data(data)
+            logger.info(f"Tentando coletar jogos da Academia das Apostas para a data: {data}")
+            
             # Formatar data para o formato usado pela Academia das Apostas (DD-MM-YYYY)
-            data_formatada = data.replace('/', '-')
+            data_formatada = data_obj.strftime('%d-%m-%Y')
             
             # URLs alternativas para tentar - atualizadas para 2025
             urls = [
@@ -443,218 +1219,38 @@ class ColetorDadosReais:
                 f"https://www.academiadasapostas.com/stats/futebol/brasil/serie-a/{data_formatada}"
             ]
             
-            # Cabeçalhos específicos para a Academia das Apostas - atualizados para 2025
-            headers_academia = {
-                'User-Agent': self._get_random_user_agent(),
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Referer': 'https://www.google.com/',
-                'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'cross-site',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'dnt': '1'
-            }
+            # Cabeçalhos comuns ficam na sessão; apenas o User-Agent varia por requisição
+            headers_academia = {'User-Agent': self._get_random_user_agent()}
             
-            # Tentar cada URL
+            # Tentar as URLs em ordem de prioridade, parando na primeira que render jogos (os
+            # dias já são coletados em paralelo; disparar todas as URLs de uma vez multiplicaria
+            # a carga nos hosts)
             for url_index, url in enumerate(urls):
                 try:
                     logger.info(f"Tentando acessar URL: {url}")
                     
-                    # Adicionar delay para evitar bloqueio
-                    time.sleep(1 + url_index * 0.5)
-                    
-                    response = requests.get(url, headers=headers_academia, timeout=20)
+                    response = self._requisitar(url, headers_academia)
                     
                     # Salvar HTML para debug
-                    data_formatada_file = data.replace('/', '')
-                    debug_file = os.path.join(self.diretorio_debug, f"academia_{data_formatada_file}_{url_index}.html")
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"HTML salvo para debug em {debug_file}")
+                    if self.debug:
+                        data_formatada_file = data.replace('/', '')
+                        debug_file = os.path.join(self.diretorio_debug, f"academia_{data_formatada_file}_{url_index}.html")
+                        self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
                     
                     if response.status_code != 200:
                         logger.warning(f"Falha ao acessar Academia das Apostas URL {url}: {response.status_code}")
                         continue
                     
                     # Parsear HTML
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Tentar diferentes seletores para encontrar jogos
-                    jogos = []
-                    
-                    # Lista de possíveis seletores para jogos - atualizados para 2025
-                    seletores_jogos = [
-                        '.match-row',                 # Novo seletor 2025
-                        '.game-row',                  # Outro seletor possível
-                        '.match',                     # Outro seletor possível
-                        'tr[data-game-id]',           # Jogos por ID
-                        'div[class*="match"]',        # Seletor genérico
-                        'div[class*="game"]',         # Seletor genérico
-                        'tr[class*="match"]',         # Seletor para tabela
-                        'tr[class*="game"]'           # Seletor para tabela
-                    ]
-                    
-                    # Tentar cada seletor
-                    for seletor in seletores_jogos:
-                        elementos_jogo = soup.select(seletor)
-                        logger.info(f"Seletor '{seletor}' encontrou {len(elementos_jogo)} elementos")
-                        
-                        if not elementos_jogo:
-                            continue
-                        
-                        # Tentar extrair informações de cada elemento
-                        for elemento in elementos_jogo:
-                            try:
-                                # Tentar diferentes seletores para times
-                                time_casa = None
-                                time_visitante = None
-                                hora = None
-                                campeonato = None
-                                
-                                # Seletores para time da casa - atualizados para 2025
-                                for seletor_casa in [
-                                    '.home-team', 
-                                    '.team-home', 
-                                    '[class*="home"]', 
-                                    '.home',
-                                    'td:nth-child(2)',
-                                    'div[class*="team"][class*="home"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_casa)
-                                    if elem and elem.text.strip():
-                                        time_casa = elem.text.strip()
-                                        break
-                                
-                                # Seletores para time visitante - atualizados para 2025
-                                for seletor_visitante in [
-                                    '.away-team', 
-                                    '.team-away', 
-                                    '[class*="away"]', 
-                                    '.away',
-                                    'td:nth-child(4)',
-                                    'div[class*="team"][class*="away"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_visitante)
-                                    if elem and elem.text.strip():
-                                        time_visitante = elem.text.strip()
-                                        break
-                                
-                                # Seletores para hora - atualizados para 2025
-                                for seletor_hora in [
-                                    '.match-time', 
-                                    '.time', 
-                                    '[class*="time"]', 
-                                    '.hour',
-                                    'td:nth-child(1)',
-                                    'div[class*="time"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_hora)
-                                    if elem and elem.text.strip():
-                                        hora = elem.text.strip()
-                                        break
-                                
-                                # Seletores para campeonato - atualizados para 2025
-                                for seletor_campeonato in [
-                                    '.league-name', 
-                                    '.competition', 
-                                    '[class*="league"]', 
-                                    '[class*="competition"]', 
-                                    '.tournament',
-                                    'div[class*="league"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_campeonato)
-                                    if elem and elem.text.strip():
-                                        campeonato = elem.text.strip()
-                                        break
-                                    
-                                    # Se não encontrou no elemento, procurar nos elementos anteriores
-                                    parent = elemento.parent
-                                    while parent and not campeonato:
-                                        elem = parent.select_one(seletor_campeonato)
-                                        if elem and elem.text.strip():
-                                            campeonato = elem.text.strip()
-                                            break
-                                        parent = parent.parent
-                                
-                                # Se não encontrou campeonato, procurar em cabeçalhos próximos
-                                if not campeonato:
-                                    for header in elemento.find_all_previous(['h2', 'h3', 'h4', 'div.league-header'], limit=3):
-                                        if header.text.strip():
-                                            campeonato = header.text.strip()
-                                            break
-                                
-                                # Se ainda não encontrou campeonato, usar um valor padrão
-                                if not campeonato:
-                                    campeonato = "Futebol"
-                                
-                                # Verificar se encontrou as informações necessárias
-                                if time_casa and time_visitante:
-                                    # Se não encontrou hora, usar um valor padrão
-                                    if not hora:
-                                        hora = "00:00"
-                                        
-                                    # Criar ID único para o jogo
-                                    id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, hora)
-                                    
-                                    # Adicionar jogo à lista
-                                    jogo = {
-                                        "id_jogo": id_jogo,
-                                        "time_casa": time_casa,
-                                        "time_visitante": time_visitante,
-                                        "data": data,
-                                        "hora": hora,
-                                        "campeonato": campeonato,
-                                        "fonte": "Academia das Apostas"
-                                    }
-                                    jogos.append(jogo)
-                                    logger.debug(f"Jogo extraído: {time_casa} vs {time_visitante}")
-                            
-                            except Exception as e:
-                                logger.error(f"Erro ao extrair informações do jogo: {str(e)}")
-                        
-                        # Se encontrou jogos com este seletor, não precisa tentar os outros
-                        if jogos:
-                            break
+                    jogos = self._extrair_jogos(soup, 'Academia das Apostas', data)
                     
                     # Se não encontrou jogos com os seletores específicos, tentar uma abordagem mais genérica
                     if not jogos:
                         logger.info("Tentando abordagem genérica para extrair jogos da Academia das Apostas")
-                        
-                        # Procurar por padrões de texto que possam indicar jogos
-                        for tag in soup.find_all(['div', 'span', 'a', 'td']):
-                            texto = tag.get_text().strip()
-                            
-                            # Padrões comuns para jogos: "Time A vs Time B", "Time A x Time B", "Time A - Time B"
-                            for separador in [' vs ', ' x ', ' - ', ' VS ', ' X ']:
-                                if separador in texto:
-                                    partes = texto.split(separador)
-                                    if len(partes) == 2:
-                                        time_casa = partes[0].strip()
-                                        time_visitante = partes[1].strip()
-                                        
-                                        # Verificar se os nomes dos times parecem válidos (pelo menos 3 caracteres)
-                                        if len(time_casa) >= 3 and len(time_visitante) >= 3:
-                                            # Criar ID único para o jogo
-                                            id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, "00:00")
-                                            
-                                            # Adicionar jogo à lista
-                                            jogo = {
-                                                "id_jogo": id_jogo,
-                                                "time_casa": time_casa,
-                                                "time_visitante": time_visitante,
-                                                "data": data,
-                                                "hora": "00:00",
-                                                "campeonato": "Futebol",
-                                                "fonte": "Academia das Apostas (Genérico)"
-                                            }
-                                            jogos.append(jogo)
+                        jogos = self._extrair_jogos_genericos(soup, ['div', 'span', 'a', 'td'], data, 'Academia das Apostas (Genérico)')
                     
                     if jogos:
                         logger.info(f"Coletados {len(jogos)} jogos da Academia das Apostas via URL {url}")
@@ -671,22 +1267,28 @@ class ColetorDadosReais:
             logger.error(f"Erro ao coletar jogos da Academia das Apostas: {str(e)}")
             return []
 
-    def _coletar_jogos_fonte_alternativa(self, data: str) -> List[Dict[str, Any]]:
+    def _coletar_jogos_fonte_alternativa(self, data: Union[str, datetime.datetime]) -> List[Dict[str, Any]]:
         """
         Coleta jogos de fontes alternativas.
 
         Args:
-            data: Data no formato DD/MM/YYYY.
+            data: Data (datetime ou string no formato DD/MM/YYYY).
 
         Returns:
             Lista de dicionários com informações dos jogos.
         """
-        logger.info(f"Tentando coletar jogos de fontes alternativas para a data: {data}")
         try:
+            data_obj, data = _converter_data(data)
+            logger.info(f"Tentando coletar jogos de fontes alternativas para a data: {data}")
+            
             # Formatar data para o formato usado pelo SofaScore (YYYY-MM-DD)
-            data_obj = datetime.datetime.strptime(data, '%d/%m/%Y')
             data_formatada = data_obj.strftime('%Y-%m-%d')
             
+            # A API JSON do SofaScore é muito mais leve que o HTML; o scraping fica como fallback
+            jogos = self._coletar_jogos_sofascore_api(data, data_formatada)
+            if jogos:
+                return jogos
+            
             # URLs alternativas para tentar - atualizadas para 2025
             urls = [
                 f"https://www.sofascore.com/football/{data_formatada}",
@@ -694,184 +1296,38 @@ class ColetorDadosReais:
                 f"https://www.sofascore.com/football/brazil/{data_formatada}"
             ]
             
-            # Cabeçalhos específicos para o SofaScore - atualizados para 2025
-            headers_sofascore = {
-                'User-Agent': self._get_random_user_agent(),
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Referer': 'https://www.google.com/',
-                'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'cross-site',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'dnt': '1'
-            }
+            # Cabeçalhos comuns ficam na sessão; apenas o User-Agent varia por requisição
+            headers_sofascore = {'User-Agent': self._get_random_user_agent()}
             
-            # Tentar cada URL
+            # Tentar as URLs em ordem de prioridade, parando na primeira que render jogos (os
+            # dias já são coletados em paralelo; disparar todas as URLs de uma vez multiplicaria
+            # a carga nos hosts)
             for url_index, url in enumerate(urls):
                 try:
                     logger.info(f"Tentando acessar SofaScore: {url}")
                     
-                    # Adicionar delay para evitar bloqueio
-                    time.sleep(1 + url_index * 0.5)
-                    
-                    response = requests.get(url, headers=headers_sofascore, timeout=20)
+                    response = self._requisitar(url, headers_sofascore)
                     
                     # Salvar HTML para debug
-                    data_formatada_file = data.replace('/', '')
-                    debug_file = os.path.join(self.diretorio_debug, f"sofascore_{data_formatada_file}_{url_index}.html")
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"HTML salvo para debug em {debug_file}")
+                    if self.debug:
+                        data_formatada_file = data.replace('/', '')
+                        debug_file = os.path.join(self.diretorio_debug, f"sofascore_{data_formatada_file}_{url_index}.html")
+                        self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
                     
                     if response.status_code != 200:
                         logger.warning(f"Falha ao acessar SofaScore: {response.status_code}")
                         continue
                     
                     # Parsear HTML
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Extrair jogos (implementação para 2025)
-                    jogos = []
-                    
-                    # Lista de possíveis seletores para jogos - atualizados para 2025
-                    seletores_jogos = [
-                        '.sc-fqkvVR',                # Seletor 2025
-                        '.event-list__item',         # Outro seletor possível
-                        '.event__match',             # Outro seletor possível
-                        'div[class*="event"]',       # Seletor genérico
-                        'div[class*="match"]',       # Seletor genérico
-                        'div[data-event-id]'         # Seletor por ID de evento
-                    ]
-                    
-                    # Tentar cada seletor
-                    for seletor in seletores_jogos:
-                        elementos_jogo = soup.select(seletor)
-                        logger.info(f"Seletor '{seletor}' encontrou {len(elementos_jogo)} elementos")
-                        
-                        if not elementos_jogo:
-                            continue
-                        
-                        # Tentar extrair informações de cada elemento
-                        for elemento in elementos_jogo:
-                            try:
-                                # Tentar diferentes seletores para times
-                                time_casa = None
-                                time_visitante = None
-                                hora = None
-                                campeonato = None
-                                
-                                # Seletores para times - atualizados para 2025
-                                times = elemento.select('.sc-dcJsrY, .event__participant, .event__team, [class*="team"], [class*="participant"]')
-                                if len(times) >= 2:
-                                    time_casa = times[0].text.strip()
-                                    time_visitante = times[1].text.strip()
-                                
-                                # Seletores para hora - atualizados para 2025
-                                for seletor_hora in [
-                                    '.sc-kAyceB', 
-                                    '.event__time', 
-                                    '.event__startTime', 
-                                    '[class*="time"]',
-                                    'span[class*="hour"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_hora)
-                                    if elem and elem.text.strip():
-                                        hora = elem.text.strip()
-                                        break
-                                
-                                # Seletores para campeonato - atualizados para 2025
-                                for seletor_campeonato in [
-                                    '.sc-gFqAkR', 
-                                    '.event__title', 
-                                    '.event__tournament', 
-                                    '[class*="tournament"]',
-                                    '[class*="league"]',
-                                    'span[class*="category"]'
-                                ]:
-                                    elem = elemento.select_one(seletor_campeonato)
-                                    if elem and elem.text.strip():
-                                        campeonato = elem.text.strip()
-                                        break
-                                
-                                # Se não encontrou campeonato, procurar em cabeçalhos próximos
-                                if not campeonato:
-                                    for header in elemento.find_all_previous(['h2', 'h3', 'h4', 'div[class*="header"]'], limit=3):
-                                        if header.text.strip():
-                                            campeonato = header.text.strip()
-                                            break
-                                
-                                # Se ainda não encontrou campeonato, usar um valor padrão
-                                if not campeonato:
-                                    campeonato = "Futebol"
-                                
-                                # Verificar se encontrou as informações necessárias
-                                if time_casa and time_visitante:
-                                    # Se não encontrou hora, usar um valor padrão
-                                    if not hora:
-                                        hora = "00:00"
-                                        
-                                    # Criar ID único para o jogo
-                                    id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, hora)
-                                    
-                                    # Adicionar jogo à lista
-                                    jogo = {
-                                        "id_jogo": id_jogo,
-                                        "time_casa": time_casa,
-                                        "time_visitante": time_visitante,
-                                        "data": data,
-                                        "hora": hora,
-                                        "campeonato": campeonato,
-                                        "fonte": "SofaScore"
-                                    }
-                                    jogos.append(jogo)
-                                    logger.debug(f"Jogo extraído: {time_casa} vs {time_visitante}")
-                            
-                            except Exception as e:
-                                logger.error(f"Erro ao extrair informações do jogo do SofaScore: {str(e)}")
-                        
-                        # Se encontrou jogos com este seletor, não precisa tentar os outros
-                        if jogos:
-                            break
+                    jogos = self._extrair_jogos(soup, 'SofaScore', data)
                     
                     # Se não encontrou jogos com os seletores específicos, tentar uma abordagem mais genérica
                     if not jogos:
                         logger.info("Tentando abordagem genérica para extrair jogos do SofaScore")
-                        
-                        # Procurar por padrões de texto que possam indicar jogos
-                        for tag in soup.find_all(['div', 'span', 'a']):
-                            texto = tag.get_text().strip()
-                            
-                            # Padrões comuns para jogos: "Time A vs Time B", "Time A x Time B", "Time A - Time B"
-                            for separador in [' vs ', ' x ', ' - ', ' VS ', ' X ']:
-                                if separador in texto:
-                                    partes = texto.split(separador)
-                                    if len(partes) == 2:
-                                        time_casa = partes[0].strip()
-                                        time_visitante = partes[1].strip()
-                                        
-                                        # Verificar se os nomes dos times parecem válidos (pelo menos 3 caracteres)
-                                        if len(time_casa) >= 3 and len(time_visitante) >= 3:
-                                            # Criar ID único para o jogo
-                                            id_jogo = self._gerar_id_jogo(time_casa, time_visitante, data, "00:00")
-                                            
-                                            # Adicionar jogo à lista
-                                            jogo = {
-                                                "id_jogo": id_jogo,
-                                                "time_casa": time_casa,
-                                                "time_visitante": time_visitante,
-                                                "data": data,
-                                                "hora": "00:00",
-                                                "campeonato": "Futebol",
-                                                "fonte": "SofaScore (Genérico)"
-                                            }
-                                            jogos.append(jogo)
+                        jogos = self._extrair_jogos_genericos(soup, ['div', 'span', 'a'], data, 'SofaScore (Genérico)')
                     
                     if jogos:
                         logger.info(f"Coletados {len(jogos)} jogos do SofaScore")
@@ -888,6 +1344,60 @@ class ColetorDadosReais:
             logger.error(f"Erro ao coletar jogos de fontes alternativas: {str(e)}")
             return []
 
+    def _coletar_jogos_sofascore_api(self, data: str, data_formatada: str) -> List[Dict[str, Any]]:
+        """
+        Coleta jogos pela API JSON do SofaScore (a mesma usada pelo site).
+
+        Args:
+            data: Data no formato DD/MM/YYYY.
+            data_formatada: Data no formato YYYY-MM-DD.
+
+        Returns:
+            Lista de dicionários com informações dos jogos (vazia em caso de falha).
+        """
+        url = f"https://api.sofascore.com/api/v1/sport/football/scheduled-events/{data_formatada}"
+        try:
+            logger.info(f"Tentando acessar API do SofaScore: {url}")
+            response = self._requisitar(url, {
+                'User-Agent': self._get_random_user_agent(),
+                'Accept': 'application/json'
+            }, tipos_aceitos=('application/json',))
+            if response.status_code != 200:
+                logger.warning(f"Falha ao acessar API do SofaScore: {response.status_code}")
+                return []
+            
+            jogos = []
+            for evento in response.json().get('events', []):
+                time_casa = (evento.get('homeTeam') or {}).get('name')
+                time_visitante = (evento.get('awayTeam') or {}).get('name')
+                if not time_casa or not time_visitante:
+                    continue
+                
+                # A API devolve eventos em torno da data (UTC); manter apenas os do dia local pedido
+                inicio = datetime.datetime.fromtimestamp(evento.get('startTimestamp', 0))
+                if inicio.strftime('%Y-%m-%d') != data_formatada:
+                    continue
+                hora = inicio.strftime('%H:%M')
+                campeonato = (evento.get('tournament') or {}).get('name') or "Futebol"
+                
+                jogos.append({
+                    "id_jogo": self._gerar_id_jogo(time_casa, time_visitante, data, hora),
+                    "time_casa": time_casa,
+                    "time_visitante": time_visitante,
+                    "data": data,
+                    "hora": hora,
+                    "campeonato": campeonato,
+                    "fonte": "SofaScore"
+                })
+            
+            if jogos:
+                logger.info(f"Coletados {len(jogos)} jogos da API do SofaScore")
+            return jogos
+        
+        except Exception as e:
+            logger.error(f"Erro ao acessar API do SofaScore: {str(e)}")
+            return []
+
     def _gerar_id_jogo(self, time_casa: str, time_visitante: str, data: str, hora: str) -> str:
         """
         Gera um ID único para o jogo.
@@ -905,33 +1415,34 @@ class ColetorDadosReais:
         time_casa_norm = self._normalizar_nome(time_casa)
         time_visitante_norm = self._normalizar_nome(time_visitante)
 
-        # Gerar hash para o jogo
+        # Gerar hash para o jogo (CRC32: basta para diferenciar jogos e é bem mais barato que MD5)
         jogo_str = f"{time_casa_norm}_{time_visitante_norm}_{data}_{hora}"
-        hash_obj = hashlib.md5(jogo_str.encode())
-        hash_hex = hash_obj.hexdigest()[:8]
+        hash_hex = f"{zlib.crc32(jogo_str.encode()):08x}"
 
         # Retornar ID no formato time_casa_time_visitante_hash
         return f"{time_casa_norm}_{time_visitante_norm}_{hash_hex}"
 
-    def _normalizar_nome(self, nome: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalizar_nome(nome: str) -> str:
         """
         Normaliza o nome do time para uso em IDs.
 
+        Os mesmos times aparecem em vários jogos, então o resultado é memorizado.
+
         Args:
             nome: Nome do time.
 
         Returns:
             Nome normalizado.
         """
-        import unicodedata
-        import re
-
-        # Remover acentos
-        nome = unicodedata.normalize('NFKD', nome).encode('ASCII', 'ignore').decode('ASCII')
+        # Remover acentos (a maioria dos nomes já é ASCII e dispensa a decomposição NFKD)
+        if not nome.isascii():
+            nome = unicodedata.normalize('NFKD', nome).encode('ASCII', 'ignore').decode('ASCII')
         # Converter para minúsculas
         nome = nome.lower()
         # Remover caracteres especiais
-        nome = re.sub(r'[^a-z0-9]', '', nome)
+        nome = _NAO_ALFANUMERICO_RE.sub('', nome)
 
         return nome
 
@@ -948,8 +1459,7 @@ class ColetorDadosReais:
                 arquivo = os.path.join(self.diretorio_jogos, f"{jogo['id_jogo']}.json")
                 
                 # Salvar jogo
-                with open(arquivo, 'w', encoding='utf-8') as f:
-                    json.dump(jogo, f, ensure_ascii=False, indent=4)
+                _gravar_json_atomico(arquivo, jogo)
                 
                 logger.info(f"Jogo salvo com sucesso em {arquivo}")
             except Exception as e:
@@ -959,45 +1469,77 @@ class ColetorDadosReais:
         """
         Coleta estatísticas para os jogos.
 
+        As requisições de cada jogo são independentes, então os jogos são
+        processados em paralelo por um pool de threads.
+
         Args:
             jogos: Lista de dicionários com informações dos jogos.
         """
-        for jogo in jogos:
-            try:
-                # Verificar se já temos estatísticas para este jogo
-                arquivo_estatisticas = os.path.join(self.diretorio_estatisticas, f"{jogo['id_jogo']}.json")
-                if os.path.exists(arquivo_estatisticas):
-                    logger.info(f"Estatísticas já existem para o jogo {jogo['id_jogo']}")
-                    continue
+        # Listar o diretório uma vez em vez de um stat() por jogo
+        existentes = set(os.listdir(self.diretorio_estatisticas))
+        
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futuros = {executor.submit(self._coletar_e_salvar, jogo, existentes): jogo for jogo in jogos}
+            for futuro in as_completed(futuros):
+                erro = futuro.exception()
+                if erro:
+                    logger.error(f"Erro ao processar o jogo {futuros[futuro].get('id_jogo', 'desconhecido')}: {str(erro)}")
+
+    def _coletar_e_salvar(self, jogo: Dict[str, Any], existentes: Optional[set] = None) -> None:
+        """
+        Coleta e salva as estatísticas de um único jogo.
 
-                # Tentar coletar estatísticas de diferentes fontes
-                estatisticas = None
-                
-                # Tentar coletar estatísticas do FlashScore
-                estatisticas = self._coletar_estatisticas_flashscore(jogo)
-                if estatisticas:
-                    # Salvar estatísticas
-                    with open(arquivo_estatisticas, 'w', encoding='utf-8') as f:
-                        json.dump(estatisticas, f, ensure_ascii=False, indent=4)
-                    
-                    logger.info(f"Estatísticas salvas com sucesso em {arquivo_estatisticas}")
-                    continue
-                
-                # Se não conseguir, tentar coletar estatísticas da Academia das Apostas
-                estatisticas = self._coletar_estatisticas_academia_apostas(jogo)
-                if estatisticas:
-                    # Salvar estatísticas
-                    with open(arquivo_estatisticas, 'w', encoding='utf-8') as f:
-                        json.dump(estatisticas, f, ensure_ascii=False, indent=4)
-                    
-                    logger.info(f"Estatísticas salvas com sucesso em {arquivo_estatisticas}")
-                    continue
-                
-                # Se não conseguir de nenhuma fonte, registrar falha
-                logger.warning(f"Não foi possível coletar estatísticas para o jogo {jogo['id_jogo']}")
-                
-            except Exception as e:
-                logger.error(f"Erro ao coletar estatísticas para o jogo {jogo.get('id_jogo', 'desconhecido')}: {str(e)}")
+        Args:
+            jogo: Dicionário com informações do jogo.
+            existentes: Nomes dos arquivos já presentes no diretório de estatísticas.
+                Se None, o disco é consultado diretamente.
+        """
+        try:
+            # Verificar se já temos estatísticas para este jogo
+            nome_arquivo = f"{jogo['id_jogo']}.json"
+            arquivo_estatisticas = os.path.join(self.diretorio_estatisticas, nome_arquivo)
+            if existentes is not None:
+                ja_existe = nome_arquivo in existentes
+            else:
+                ja_existe = os.path.exists(arquivo_estatisticas)
+            if ja_existe:
+                logger.info(f"Estatísticas já existem para o jogo {jogo['id_jogo']}")
+                return
+
+            # Tentar coletar estatísticas do FlashScore
+            estatisticas = self._coletar_estatisticas_flashscore(jogo)
+            if estatisticas:
+                self._salvar_estatisticas_exclusivo(arquivo_estatisticas, estatisticas)
+                return
+            
+            # Se não conseguir, usar as estatísticas da Academia das Apostas
+            estatisticas = self._coletar_estatisticas_academia_apostas(jogo)
+            if estatisticas:
+                self._salvar_estatisticas_exclusivo(arquivo_estatisticas, estatisticas)
+                return
+            
+            # Se não conseguir de nenhuma fonte, registrar falha
+            logger.warning(f"Não foi possível coletar estatísticas para o jogo {jogo['id_jogo']}")
+            
+        except Exception as e:
+            logger.error(f"Erro ao coletar estatísticas para o jogo {jogo.get('id_jogo', 'desconhecido')}: {str(e)}")
+
+    def _salvar_estatisticas_exclusivo(self, arquivo: str, estatisticas: Dict[str, Any]) -> None:
+        """
+        Salva as estatísticas apenas se o arquivo ainda não existir.
+
+        A gravação é atômica e exclusiva, então se dois workers processarem o mesmo jogo
+        (IDs repetidos na lista), só o primeiro grava.
+
+        Args:
+            arquivo: Caminho do arquivo de estatísticas.
+            estatisticas: Estatísticas coletadas.
+        """
+        if not _gravar_json_atomico(arquivo, estatisticas, substituir=False):
+            logger.info(f"Estatísticas já salvas por outra tarefa em {arquivo}")
+            return
+        
+        logger.info(f"Estatísticas salvas com sucesso em {arquivo}")
 
     def _coletar_estatisticas_flashscore(self, jogo: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -1017,89 +1559,68 @@ class ColetorDadosReais:
             query = f"{time_casa} {time_visitante}"
             url = f"https://www.flashscore.com.br/pesquisa/?q={query.replace(' ', '+')}"
 
-            # Fazer requisição HTTP com cabeçalhos atualizados
+            # Cabeçalhos comuns ficam na sessão; aqui só o que muda para navegação dentro do site
             headers_flashscore = {
                 'User-Agent': self._get_random_user_agent(),
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
                 'Referer': 'https://www.flashscore.com.br/',
-                'Host': 'www.flashscore.com.br',
-                'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'same-origin',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'dnt': '1'
+                'Sec-Fetch-Site': 'same-origin'
             }
             
-            # Adicionar delay para evitar bloqueio
-            time.sleep(1.5)
-            
-            response = requests.get(url, headers=headers_flashscore, timeout=20)
+            # Delay para evitar bloqueio (só quando a página não está em cache)
+            response = self._requisitar_com_cache(url, headers_flashscore, espera=1.5)
             
             # Salvar HTML para debug
-            debug_file = os.path.join(self.diretorio_debug, f"flashscore_stats_search_{jogo['id_jogo']}.html")
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            logger.info(f"HTML de busca salvo para debug em {debug_file}")
+            if self.debug:
+                debug_file = os.path.join(self.diretorio_debug, f"flashscore_stats_search_{jogo['id_jogo']}.html")
+                self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
             
             if response.status_code != 200:
                 logger.warning(f"Falha ao acessar FlashScore: {response.status_code}")
                 return None
 
             # Parsear HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Encontrar link para a página do jogo - seletores atualizados para 2025
-            links = soup.select('.event__match, [class*="event"], [class*="match"], a[href*="/jogo/"], div[id*="g_1"]')
-            if not links:
-                logger.warning(f"Nenhum resultado encontrado para {query}")
-                return None
-
-            # Pegar o primeiro link que parece ser um jogo
-            link_jogo = None
-            for link in links:
-                texto_link = link.text.lower()
-                if time_casa.lower() in texto_link and time_visitante.lower() in texto_link:
-                    link_jogo = link
-                    break
-
-            if not link_jogo:
+            arvore = _arvore_html(response)
+
+            # Encontrar o primeiro resultado que parece ser o jogo - seletores atualizados para 2025
+            encontrados = self.BUSCA_FS_JOGO(
+                arvore,
+                casa=time_casa.lower(),
+                visitante=time_visitante.lower(),
+                maiusculas=_MAIUSCULAS,
+                minusculas=_MINUSCULAS
+            )
+            if not encontrados:
                 logger.warning(f"Nenhum jogo encontrado para {query}")
                 return None
+            link_jogo = encontrados[0]
 
             # Extrair ID do jogo do FlashScore
             id_flashscore = None
             for attr in ['id', 'data-id', 'data-event-id', 'data-match-id']:
-                if link_jogo.has_attr(attr):
-                    id_flashscore = link_jogo[attr]
+                if link_jogo.get(attr) is not None:
+                    id_flashscore = link_jogo.get(attr)
                     break
             
             # Se não encontrou pelo atributo, tentar extrair da URL
-            if not id_flashscore and link_jogo.has_attr('href'):
-                href = link_jogo['href']
+            if not id_flashscore and link_jogo.get('href') is not None:
+                href = link_jogo.get('href')
                 # Extrair ID da URL (formato típico: /jogo/ABCDEF/)
-                match = re.search(r'/jogo/([^/]+)', href)
+                match = _ID_FLASHSCORE_RE.search(href)
                 if match:
                     id_flashscore = match.group(1)
                     
             # Se ainda não encontrou, tentar extrair de um elemento pai
             if not id_flashscore:
-                parent = link_jogo.parent
+                parent = link_jogo.getparent()
                 for i in range(3):  # Verificar até 3 níveis acima
-                    if parent:
+                    if parent is not None:
                         for attr in ['id', 'data-id', 'data-event-id', 'data-match-id']:
-                            if parent.has_attr(attr):
-                                id_flashscore = parent[attr]
+                            if parent.get(attr) is not None:
+                                id_flashscore = parent.get(attr)
                                 break
                         if id_flashscore:
                             break
-                        parent = parent.parent
+                        parent = parent.getparent()
                     else:
                         break
 
@@ -1118,23 +1639,20 @@ class ColetorDadosReais:
             # Tentar cada URL
             for url_index, url_estatisticas in enumerate(urls_estatisticas):
                 try:
-                    # Adicionar delay para evitar bloqueio
-                    time.sleep(1 + url_index * 0.5)
-                    
-                    response = requests.get(url_estatisticas, headers=headers_flashscore, timeout=20)
+                    # Delay para evitar bloqueio (só quando a página não está em cache)
+                    response = self._requisitar_com_cache(url_estatisticas, headers_flashscore, espera=1 + url_index * 0.5)
                     
                     # Salvar HTML para debug
-                    debug_file = os.path.join(self.diretorio_debug, f"flashscore_stats_{jogo['id_jogo']}_{url_index}.html")
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"HTML de estatísticas salvo para debug em {debug_file}")
+                    if self.debug:
+                        debug_file = os.path.join(self.diretorio_debug, f"flashscore_stats_{jogo['id_jogo']}_{url_index}.html")
+                        self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
                     
                     if response.status_code != 200:
                         logger.warning(f"Falha ao acessar página de estatísticas: {response.status_code}")
                         continue
                     
-                    # Parsear HTML
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    # Parsear HTML (só seletores lxml são usados nesta página)
+                    arvore = _arvore_html(response)
                     
                     # Extrair estatísticas
                     estatisticas = {
@@ -1147,27 +1665,27 @@ class ColetorDadosReais:
                     }
                     
                     # Extrair categorias de estatísticas - seletores atualizados para 2025
-                    categorias = soup.select('.statCategory, [class*="statistic"], [class*="stat"], [class*="category"], div[class*="stats"]')
+                    categorias = self.SELETOR_FS_STATS_CATEGORIAS(arvore)
                     
                     for categoria in categorias:
                         try:
-                            titulo_elem = categoria.select_one('.statCategoryName, [class*="categoryName"], [class*="title"], [class*="header"]')
-                            titulo = titulo_elem.text.strip() if titulo_elem else "Estatísticas Gerais"
+                            titulo_elem = _primeiro(self.SELETOR_FS_STATS_TITULO, categoria)
+                            titulo = _texto_lxml(titulo_elem) if titulo_elem is not None else "Estatísticas Gerais"
                             
                             estatisticas_categoria = {}
                             
                             # Extrair linhas de estatísticas - seletores atualizados para 2025
-                            linhas = categoria.select('.statRow, [class*="statRow"], [class*="row"], [class*="item"], div[class*="stat"]')
+                            linhas = self.SELETOR_FS_STATS_LINHAS(categoria)
                             for linha in linhas:
                                 try:
-                                    nome_elem = linha.select_one('.statName, [class*="statName"], [class*="name"], [class*="label"]')
-                                    nome = nome_elem.text.strip() if nome_elem else "Desconhecido"
+                                    nome_elem = _primeiro(self.SELETOR_FS_STATS_NOME, linha)
+                                    nome = _texto_lxml(nome_elem) if nome_elem is not None else "Desconhecido"
                                     
-                                    valor_casa_elem = linha.select_one('.statHome, [class*="home"], [class*="team1"], [class*="left"]')
-                                    valor_casa = valor_casa_elem.text.strip() if valor_casa_elem else "0"
+                                    valor_casa_elem = _primeiro(self.SELETOR_FS_STATS_CASA, linha)
+                                    valor_casa = _texto_lxml(valor_casa_elem) if valor_casa_elem is not None else "0"
                                     
-                                    valor_visitante_elem = linha.select_one('.statAway, [class*="away"], [class*="team2"], [class*="right"]')
-                                    valor_visitante = valor_visitante_elem.text.strip() if valor_visitante_elem else "0"
+                                    valor_visitante_elem = _primeiro(self.SELETOR_FS_STATS_VISITANTE, linha)
+                                    valor_visitante = _texto_lxml(valor_visitante_elem) if valor_visitante_elem is not None else "0"
                                     
                                     estatisticas_categoria[nome] = {
                                         "casa": valor_casa,
@@ -1213,54 +1731,41 @@ class ColetorDadosReais:
             query = f"futebol ao vivo {time_casa} {time_visitante}"
             url = f"https://www.academiadasapostas.com/stats/search?q={query.replace(' ', '+')}"
 
-            # Fazer requisição HTTP com cabeçalhos atualizados
+            # Cabeçalhos comuns ficam na sessão; aqui só o que muda para navegação dentro do site
             headers_academia = {
                 'User-Agent': self._get_random_user_agent(),
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
                 'Referer': 'https://www.academiadasapostas.com/',
-                'sec-ch-ua': '"Chromium";v="120", "Google Chrome";v="120", "Not-A.Brand";v="99"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'same-origin',
-                'Sec-Fetch-User': '?1',
-                'Upgrade-Insecure-Requests': '1',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'dnt': '1'
+                'Sec-Fetch-Site': 'same-origin'
             }
             
-            # Adicionar delay para evitar bloqueio
-            time.sleep(1.5)
-            
-            response = requests.get(url, headers=headers_academia, timeout=20)
+            # Delay para evitar bloqueio (só quando a página não está em cache)
+            response = self._requisitar_com_cache(url, headers_academia, espera=1.5)
             
             # Salvar HTML para debug
-            debug_file = os.path.join(self.diretorio_debug, f"academia_stats_search_{jogo['id_jogo']}.html")
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            logger.info(f"HTML de busca salvo para debug em {debug_file}")
+            if self.debug:
+                debug_file = os.path.join(self.diretorio_debug, f"academia_stats_search_{jogo['id_jogo']}.html")
+                self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
             
             if response.status_code != 200:
                 logger.warning(f"Falha ao acessar Academia das Apostas: {response.status_code}")
                 return None
 
             # Parsear HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Encontrar link para a página do jogo - seletores atualizados para 2025
-            links = soup.select('a[href*="/stats/"], a[href*="/match/"], a[href*="/game/"], .match-row a, .game-row a')
+            links = self.SELETOR_ACADEMIA_STATS_LINKS.select(soup)
             if not links:
                 logger.warning(f"Nenhum resultado encontrado para {query}")
                 return None
 
             # Pegar o primeiro link que parece ser um jogo
+            casa_min = time_casa.lower()
+            visitante_min = time_visitante.lower()
             link_jogo = None
             for link in links:
                 texto_link = link.text.lower()
-                if time_casa.lower() in texto_link and time_visitante.lower() in texto_link:
+                if casa_min in texto_link and visitante_min in texto_link:
                     link_jogo = link
                     break
 
@@ -1278,20 +1783,19 @@ class ColetorDadosReais:
                 url_jogo = f"https://www.academiadasapostas.com{url_jogo}"
 
             # Acessar página do jogo
-            response = requests.get(url_jogo, headers=headers_academia, timeout=20)
+            response = self._requisitar_com_cache(url_jogo, headers_academia)
             
             # Salvar HTML para debug
-            debug_file = os.path.join(self.diretorio_debug, f"academia_stats_{jogo['id_jogo']}.html")
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            logger.info(f"HTML de estatísticas salvo para debug em {debug_file}")
+            if self.debug:
+                debug_file = os.path.join(self.diretorio_debug, f"academia_stats_{jogo['id_jogo']}.html")
+                self._debug_exec.submit(self._escrever_debug, debug_file, response.content)
             
             if response.status_code != 200:
                 logger.warning(f"Falha ao acessar página do jogo: {response.status_code}")
                 return None
 
-            # Parsear HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parsear HTML (só seletores lxml são usados nesta página)
+            arvore = _arvore_html(response)
 
             # Extrair estatísticas
             estatisticas = {
@@ -1304,27 +1808,27 @@ class ColetorDadosReais:
             }
 
             # Extrair categorias de estatísticas - seletores atualizados para 2025
-            categorias = soup.select('.stats-section, .stats-category, [class*="stats"], [class*="statistics"]')
+            categorias = self.SELETOR_ACADEMIA_STATS_CATEGORIAS(arvore)
             
             for categoria in categorias:
                 try:
-                    titulo_elem = categoria.select_one('h2, h3, .section-title, .category-title, [class*="title"]')
-                    titulo = titulo_elem.text.strip() if titulo_elem else "Estatísticas Gerais"
+                    titulo_elem = _primeiro(self.SELETOR_ACADEMIA_STATS_TITULO, categoria)
+                    titulo = _texto_lxml(titulo_elem) if titulo_elem is not None else "Estatísticas Gerais"
                     
                     estatisticas_categoria = {}
 
                     # Extrair linhas de estatísticas - seletores atualizados para 2025
-                    linhas = categoria.select('.stats-row, .stat-item, tr[class*="stat"], [class*="stat-row"]')
+                    linhas = self.SELETOR_ACADEMIA_STATS_LINHAS(categoria)
                     for linha in linhas:
                         try:
-                            nome_elem = linha.select_one('.stat-name, .stat-label, td:nth-child(2), [class*="name"], [class*="label"]')
-                            nome = nome_elem.text.strip() if nome_elem else "Desconhecido"
+                            nome_elem = _primeiro(self.SELETOR_ACADEMIA_STATS_NOME, linha)
+                            nome = _texto_lxml(nome_elem) if nome_elem is not None else "Desconhecido"
                             
-                            valor_casa_elem = linha.select_one('.home-value, .team1-value, td:nth-child(1), [class*="home"], [class*="team1"]')
-                            valor_casa = valor_casa_elem.text.strip() if valor_casa_elem else "0"
+                            valor_casa_elem = _primeiro(self.SELETOR_ACADEMIA_STATS_CASA, linha)
+                            valor_casa = _texto_lxml(valor_casa_elem) if valor_casa_elem is not None else "0"
                             
-                            valor_visitante_elem = linha.select_one('.away-value, .team2-value, td:nth-child(3), [class*="away"], [class*="team2"]')
-                            valor_visitante = valor_visitante_elem.text.strip() if valor_visitante_elem else "0"
+                            valor_visitante_elem = _primeiro(self.SELETOR_ACADEMIA_STATS_VISITANTE, linha)
+                            valor_visitante = _texto_lxml(valor_visitante_elem) if valor_visitante_elem is not None else "0"
                             
                             estatisticas_categoria[nome] = {
                                 "casa": valor_casa,
@@ -1342,24 +1846,24 @@ class ColetorDadosReais:
                 logger.info("Tentando abordagem genérica para extrair estatísticas")
                 
                 # Procurar por tabelas que possam conter estatísticas
-                tabelas = soup.select('table, .stats-table, [class*="stats-table"]')
+                tabelas = self.SELETOR_ACADEMIA_STATS_TABELAS(arvore)
                 for tabela in tabelas:
                     try:
                         # Tentar extrair título da tabela
-                        titulo_elem = tabela.find_previous(['h2', 'h3', 'h4', '.section-title', '.category-title'])
-                        titulo = titulo_elem.text.strip() if titulo_elem else "Estatísticas Gerais"
+                        titulo_elem = _primeiro(self.TITULO_TABELA, tabela)
+                        titulo = _texto_lxml(titulo_elem) if titulo_elem is not None else "Estatísticas Gerais"
                         
                         estatisticas_categoria = {}
                         
                         # Extrair linhas da tabela
-                        linhas = tabela.select('tr')
+                        linhas = self.SELETOR_LINHAS_TABELA(tabela)
                         for linha in linhas:
                             try:
-                                colunas = linha.select('td, th')
+                                colunas = self.SELETOR_CELULAS_TABELA(linha)
                                 if len(colunas) >= 3:
-                                    valor_casa = colunas[0].text.strip()
-                                    nome = colunas[1].text.strip()
-                                    valor_visitante = colunas[2].text.strip()
+                                    valor_casa = _texto_lxml(colunas[0])
+                                    nome = _texto_lxml(colunas[1])
+                                    valor_visitante = _texto_lxml(colunas[2])
                                     
                                     if nome and nome != "":
                                         estatisticas_categoria[nome] = {
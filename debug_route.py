@@ -3,7 +3,6 @@ Módulo para criar rotas temporárias de debug para visualizar e baixar arquivos
 """
 from flask import Blueprint, render_template, send_file, abort, current_app, jsonify
 import os
-import glob
 
 # Criar um Blueprint para as rotas de debug
 debug_bp = Blueprint('debug', __name__, url_prefix='/debug')
@@ -11,6 +10,25 @@ debug_bp = Blueprint('debug', __name__, url_prefix='/debug')
 # Diretório onde os arquivos de debug estão armazenados
 DEBUG_DIR = '/opt/render/project/src/dados/debug/'
 
+def _listar_arquivos_html():
+    """
+    Listar os arquivos HTML do diretório de debug com tamanho e data de modificação,
+    usando uma única passada de os.scandir (sem um stat separado para cada informação)
+    """
+    files_info = []
+    with os.scandir(DEBUG_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.html') or not entry.is_file():
+                continue
+            stat = entry.stat()
+            files_info.append({
+                'name': entry.name,
+                'path': entry.path,
+                'size': stat.st_size,
+                'time': stat.st_mtime
+            })
+    return files_info
+
 @debug_bp.route('/')
 def index():
     """
@@ -25,7 +43,7 @@ def index():
             }), 404
         
         # Listar todos os arquivos HTML no diretório de debug
-        html_files = glob.glob(os.path.join(DEBUG_DIR, '*.html'))
+        html_files = _listar_arquivos_html()
         
         # Organizar os arquivos por tipo
         files_by_type = {
@@ -35,26 +53,10 @@ def index():
             'outros': []
         }
         
-        for file_path in html_files:
-            file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
-            file_time = os.path.getmtime(file_path)
-            
-            file_info = {
-                'name': file_name,
-                'path': file_path,
-                'size': file_size,
-                'time': file_time
-            }
-            
-            if 'flashscore' in file_name:
-                files_by_type['flashscore'].append(file_info)
-            elif 'academia' in file_name:
-                files_by_type['academia'].append(file_info)
-            elif 'sofascore' in file_name:
-                files_by_type['sofascore'].append(file_info)
-            else:
-                files_by_type['outros'].append(file_info)
+        # Os arquivos de debug são nomeados com a fonte como prefixo (ex.: flashscore_stats_...)
+        for file_info in html_files:
+            prefixo = file_info['name'].partition('_')[0]
+            files_by_type.get(prefixo, files_by_type['outros']).append(file_info)
         
         # Retornar os dados como JSON
         return jsonify({
@@ -83,12 +85,8 @@ def view_file(filename):
                 'path': file_path
             }), 404
         
-        # Ler o conteúdo do arquivo
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Retornar o conteúdo como HTML
-        return content, 200, {'Content-Type': 'text/html'}
+        # Enviar o arquivo como HTML em streaming (com suporte a If-Modified-Since/ETag)
+        return send_file(file_path, mimetype='text/html', conditional=True)
     
     except Exception as e:
         return jsonify({
@@ -131,25 +129,8 @@ def list_files():
                 'path': DEBUG_DIR
             }), 404
         
-        # Listar todos os arquivos no diretório de debug
-        files = os.listdir(DEBUG_DIR)
-        
-        # Filtrar apenas arquivos HTML
-        html_files = [f for f in files if f.endswith('.html')]
-        
-        # Obter informações detalhadas sobre cada arquivo
-        files_info = []
-        for file_name in html_files:
-            file_path = os.path.join(DEBUG_DIR, file_name)
-            file_size = os.path.getsize(file_path)
-            file_time = os.path.getmtime(file_path)
-            
-            files_info.append({
-                'name': file_name,
-                'path': file_path,
-                'size': file_size,
-                'time': file_time
-            })
+        # Listar os arquivos HTML com informações detalhadas sobre cada um
+        files_info = _listar_arquivos_html()
         
         # Ordenar por data de modificação (mais recentes primeiro)
         files_info.sort(key=lambda x: x['time'], reverse=True)
@@ -6,9 +6,84 @@ from flask import render_template, request, redirect, url_for, flash
 from flask_login import login_required
 import json
 import os
-import re
+import threading
 import datetime
 
+from coleta_dados_reais import _carregar_json, _gravar_atomico
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# RE2 (google-re2) garante tempo linear nos textos colados pelo usuário; os padrões
+# abaixo são compatíveis com os dois motores
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Padrões usados na identificação de jogos e da tabela de classificação (os da tabela
+# são aplicados com match, pois cada campo começa a sua linha)
+_DATA_RE = re.compile(r'\d{2}/\d{2}/\d{4}')
+_CAMPEONATO_RE = re.compile(r'Brasileirão|Série|Copa|Campeonato')
+_POSICAO_RE = re.compile(r'Posição:\s*(\d+)')
+_PONTOS_RE = re.compile(r'Pontos:\s*(\d+)')
+_VITORIAS_RE = re.compile(r'Vitórias:\s*(\d+)')
+
+def _serializar_json(dados):
+    """
+    Serializa dados em JSON compacto (bytes UTF-8), usando orjson quando disponível
+    """
+    if orjson is not None:
+        return orjson.dumps(dados)
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _gravar_json_atomico(caminho, dados):
+    """
+    Grava dados em JSON compacto de forma atômica (com fsync e as permissões padrão),
+    para que nunca se leia um arquivo pela metade
+    """
+    _gravar_atomico(caminho, _serializar_json(dados))
+
+# Cache em processo do arquivo de jogos, invalidado pelo mtime do arquivo. A trava
+# também serializa o ciclo leitura-gravação entre requisições concorrentes.
+_cache_jogos = {'caminho': None, 'mtime': None, 'jogos': [], 'ids': set()}
+_trava_jogos = threading.Lock()
+
+def _carregar_jogos(caminho):
+    """
+    Retorna a lista de jogos salvos e o conjunto de seus IDs, relendo o arquivo
+    apenas quando ele mudou desde a última leitura. Deve ser chamada com
+    _trava_jogos adquirida; os objetos retornados não devem ser alterados.
+    """
+    try:
+        st = os.stat(caminho)
+    except OSError:
+        return [], set()
+    
+    mtime = st.st_mtime_ns
+    if _cache_jogos['caminho'] == caminho and _cache_jogos['mtime'] == mtime:
+        return _cache_jogos['jogos'], _cache_jogos['ids']
+    
+    # Arquivo vazio ou com uma lista vazia ("[]"): não há o que ler
+    jogos = []
+    if st.st_size > 2:
+        try:
+            with open(caminho, 'rb') as f:
+                jogos = _carregar_json(f.read())
+        except (OSError, ValueError):
+            jogos = []
+    
+    _atualizar_cache_jogos(caminho, mtime, jogos, {j.get('id_jogo') for j in jogos})
+    return _cache_jogos['jogos'], _cache_jogos['ids']
+
+def _atualizar_cache_jogos(caminho, mtime, jogos, ids):
+    """
+    Substitui o conteúdo do cache de jogos
+    """
+    _cache_jogos.update(caminho=caminho, mtime=mtime, jogos=jogos, ids=ids)
+
 def processar_texto_copiado(texto):
     """
     Processa texto copiado do site Academia das Apostas Brasil
@@ -22,34 +97,41 @@ def processar_texto_copiado(texto):
     if not texto or len(texto.strip()) < 10:
         return {'erro': 'Texto muito curto ou vazio'}
     
-    linhas = texto.strip().split('\n')
-    linhas = [l.strip() for l in linhas if l.strip()]
+    # Sem nenhum dos marcadores de jogo (" vs ") ou de tabela ("Posição:") não há o que
+    # extrair; evita dividir e percorrer textos que não vieram do site
+    if ' vs ' not in texto and 'Posição:' not in texto:
+        return resultado
+    
+    linhas = [l for l in map(str.strip, texto.split('\n')) if l]
     
-    # Tentar identificar jogos
-    for i in range(len(linhas) - 2):
-        if 'vs' in linhas[i] and i+2 < len(linhas):
+    # Percorrer as linhas uma única vez, identificando jogos e a tabela de classificação
+    total_linhas = len(linhas)
+    for i, linha in enumerate(linhas):
+        # Tentar identificar jogos ("Time A vs Time B"; o separador com espaços evita
+        # falsos positivos com nomes que contêm "vs")
+        if ' vs ' in linha and i+2 < total_linhas:
             # Possível jogo encontrado
-            times = linhas[i].split('vs')
-            if len(times) == 2:
-                time_casa = times[0].strip()
-                time_visitante = times[1].strip()
+            casa, _, visitante = linha.partition(' vs ')
+            if ' vs ' not in visitante:
+                time_casa = casa.strip()
+                time_visitante = visitante.strip()
                 
                 # Verificar se a próxima linha contém data/hora
                 data_hora = ""
                 campeonato = ""
                 
-                if i+1 < len(linhas) and re.search(r'\d{2}/\d{2}/\d{4}', linhas[i+1]):
-                    data_hora = linhas[i+1].strip()
+                if '/' in linhas[i+1] and _DATA_RE.search(linhas[i+1]):
+                    data_hora = linhas[i+1]
                     
                     # Verificar se a linha seguinte contém o campeonato
-                    if i+2 < len(linhas) and ('Brasileirão' in linhas[i+2] or 'Série' in linhas[i+2] or 'Copa' in linhas[i+2] or 'Campeonato' in linhas[i+2]):
-                        campeonato = linhas[i+2].strip()
+                    if _CAMPEONATO_RE.search(linhas[i+2]):
+                        campeonato = linhas[i+2]
                     else:
                         campeonato = "Campeonato não identificado"
                 
-                    # Extrair data e hora
-                    data = data_hora.split(' - ')[0] if ' - ' in data_hora else data_hora
-                    hora = data_hora.split(' - ')[1] if ' - ' in data_hora else '00:00'
+                    # Extrair data e hora ("DD/MM/AAAA - HH:MM")
+                    data, separador, resto = data_hora.partition(' - ')
+                    hora = resto.partition(' - ')[0] if separador else '00:00'
                     
                     # Gerar ID único para o jogo
                     id_jogo = f"{time_casa.lower().replace(' ', '_')}_{time_visitante.lower().replace(' ', '_')}_{data.replace('/', '')}"
@@ -66,17 +148,19 @@ def processar_texto_copiado(texto):
                     
                     # Adicionar à lista de jogos
                     resultado['jogos'].append(jogo)
-    
-    # Tentar identificar tabela de classificação
-    posicao_pattern = re.compile(r'Posição:\s*(\d+)')
-    pontos_pattern = re.compile(r'Pontos:\s*(\d+)')
-    vitorias_pattern = re.compile(r'Vitórias:\s*(\d+)')
-    
-    for i in range(len(linhas)):
-        if i+6 < len(linhas) and posicao_pattern.search(linhas[i+1]) and pontos_pattern.search(linhas[i+2]) and vitorias_pattern.search(linhas[i+3]):
-            time = linhas[i].strip()
-            posicao = int(posicao_pattern.search(linhas[i+1]).group(1))
-            pontos = int(pontos_pattern.search(linhas[i+2]).group(1))
+        
+        # Tentar identificar tabela de classificação (os testes literais evitam rodar as
+        # expressões regulares na grande maioria das linhas, que não fazem parte da tabela)
+        if (i+6 < total_linhas and linhas[i+1].startswith('Posição:') and linhas[i+2].startswith('Pontos:')
+                and linhas[i+3].startswith('Vitórias:')):
+            posicao_match = _POSICAO_RE.match(linhas[i+1])
+            pontos_match = _PONTOS_RE.match(linhas[i+2])
+            if not (posicao_match and pontos_match and _VITORIAS_RE.match(linhas[i+3])):
+                continue
+            
+            time = linha
+            posicao = int(posicao_match.group(1))
+            pontos = int(pontos_match.group(1))
             
             # Adicionar à tabela de classificação
             resultado['tabela_classificacao'].append({
@@ -116,26 +200,27 @@ def registrar_entrada_manual(app):
                     # Salvar jogos em arquivo
                     jogos_file = app.config.get('JOGOS_FILE', 'jogos_disponiveis.json')
                     
-                    jogos_existentes = []
-                    if os.path.exists(jogos_file):
-                        try:
-                            with open(jogos_file, 'r') as f:
-                                jogos_existentes = json.load(f)
-                        except:
-                            jogos_existentes = []
-                    
-                    # Adicionar novos jogos
-                    ids_existentes = [j.get('id_jogo') for j in jogos_existentes]
-                    novos_jogos = 0
-                    
-                    for jogo in resultado['jogos']:
-                        if jogo['id_jogo'] not in ids_existentes:
-                            jogos_existentes.append(jogo)
-                            novos_jogos += 1
-                    
-                    # Salvar jogos atualizados
-                    with open(jogos_file, 'w') as f:
-                        json.dump(jogos_existentes, f, indent=2)
+                    with _trava_jogos:
+                        jogos_existentes, ids_existentes = _carregar_jogos(jogos_file)
+                        
+                        # Adicionar novos jogos (sem alterar as listas do cache)
+                        adicionados = []
+                        ids_adicionados = set()
+                        
+                        for jogo in resultado['jogos']:
+                            id_jogo = jogo['id_jogo']
+                            if id_jogo not in ids_existentes and id_jogo not in ids_adicionados:
+                                adicionados.append(jogo)
+                                ids_adicionados.add(id_jogo)
+                        
+                        novos_jogos = len(adicionados)
+                        
+                        # Salvar jogos atualizados (o arquivo só é reescrito se houver jogos novos)
+                        if novos_jogos:
+                            jogos_atualizados = jogos_existentes + adicionados
+                            _gravar_json_atomico(jogos_file, jogos_atualizados)
+                            _atualizar_cache_jogos(jogos_file, os.stat(jogos_file).st_mtime_ns,
+                                                   jogos_atualizados, ids_existentes | ids_adicionados)
                     
                     flash(f'Processamento concluído com sucesso! {novos_jogos} novos jogos adicionados.', 'success')
                     return redirect(url_for('dashboard'))
@@ -5,9 +5,18 @@ Este módulo integra o processador de dados copiados com o sistema de apostas es
 """
 
 import os
+import copy
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, TextIO, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Importar módulos do sistema
 from processador_texto_copiado import ProcessadorTextoCopiadoAcademiaApostas
@@ -20,6 +29,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger('integracao_sistema')
 
+# Número máximo de jogos com estatísticas mantidas em memória
+TAMANHO_CACHE_ESTATISTICAS = 512
+
+# Fator de vantagem para o time da casa
+VANTAGEM_MANDANTE = 1.2
+
+def _opcoes_json(compacto: bool) -> Dict[str, Any]:
+    """
+    Opções de formatação dos relatórios JSON: indentado por padrão, ou compacto.
+    """
+    if compacto:
+        return {'separators': (',', ':')}
+    return {'indent': 2}
+
+def _serializar_relatorio(relatorio: Dict[str, Any], compacto: bool = False) -> str:
+    """
+    Serializa um relatório em JSON, usando orjson quando disponível.
+    
+    Args:
+        relatorio: Relatório a serializar
+        compacto: Se True, gera JSON sem indentação nem espaços.
+        
+    Returns:
+        String JSON do relatório.
+    """
+    if orjson is not None:
+        opcoes = orjson.OPT_NON_STR_KEYS if compacto else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(relatorio, option=opcoes).decode('utf-8')
+    return json.dumps(relatorio, ensure_ascii=False, **_opcoes_json(compacto))
+
+@lru_cache(maxsize=256)
+def _forca_em_cache(pontos: float, vitorias: float, empates: float, derrotas: float,
+                    gols_marcados: float, gols_sofridos: float) -> float:
+    """
+    Calcula a força de um time a partir de suas estatísticas (ver _calcular_forca_time).
+    Memorizada: em lotes de relatórios, o mesmo time (com as mesmas estatísticas)
+    aparece em vários jogos e sua força só é calculada uma vez.
+    """
+    # Calcular número de jogos
+    jogos = vitorias + empates + derrotas
+    
+    if jogos == 0:
+        return 1.0  # Valor padrão se não houver jogos
+    
+    # Calcular média de pontos por jogo
+    media_pontos = pontos / jogos
+    
+    # Calcular saldo de gols
+    saldo_gols = gols_marcados - gols_sofridos
+    
+    # Calcular média de gols marcados e sofridos
+    media_gols_marcados = gols_marcados / jogos
+    media_gols_sofridos = gols_sofridos / jogos if gols_sofridos > 0 else 0.5  # Evitar divisão por zero
+    
+    # Calcular força com base em pontos, saldo de gols e médias
+    forca = (media_pontos * 2) + (saldo_gols * 0.1) + (media_gols_marcados * 0.5) - (media_gols_sofridos * 0.3)
+    
+    # Ajustar para valor positivo
+    return max(0.5, forca)
+
 class SistemaApostasEsportivas:
     """
     Classe principal do sistema de apostas esportivas, integrando todos os componentes.
@@ -44,7 +113,16 @@ class SistemaApostasEsportivas:
         self.processador = ProcessadorTextoCopiadoAcademiaApostas()
         self.coletor = ColetorDadosReais(diretorio_dados=self.diretorio_dados)
         
-        logger.info(f"Sistema de apostas esportivas inicializado. Diretório de dados: {self.diretorio_dados}")
+        # Índice dos jogos salvos por ID, reconstruído quando o diretório de jogos muda
+        self._jogos_por_id: Dict[str, Dict[str, Any]] = {}
+        self._jogos_mtime: Optional[int] = None
+        
+        # Cache LRU de estatísticas por ID do jogo, validado pelo mtime do arquivo. A trava
+        # protege a reordenação e o descarte, já que o app Flask atende em várias threads
+        self._estatisticas_cache: 'OrderedDict[str, Tuple[int, Dict[str, Any]]]' = OrderedDict()
+        self._estatisticas_lock = threading.Lock()
+        
+        logger.info("Sistema de apostas esportivas inicializado. Diretório de dados: %s", self.diretorio_dados)
     
     def processar_texto_copiado(self, texto: str) -> Dict[str, Any]:
         """
@@ -77,7 +155,7 @@ class SistemaApostasEsportivas:
                             )
                             estatisticas[jogo['id_jogo']] = estatisticas_jogo
                         except Exception as e:
-                            logger.error(f"Erro ao extrair estatísticas para o jogo {jogo['id_jogo']}: {str(e)}")
+                            logger.error("Erro ao extrair estatísticas para o jogo %s: %s", jogo['id_jogo'], e)
                     
                     resultado['estatisticas'] = estatisticas
                 
@@ -89,7 +167,7 @@ class SistemaApostasEsportivas:
             return resultado
             
         except Exception as e:
-            logger.error(f"Erro ao processar texto copiado: {str(e)}")
+            logger.error("Erro ao processar texto copiado: %s", e)
             return {"erro": str(e)}
     
     def coletar_jogos_do_dia(self, data: Optional[str] = None, dias_futuros: int = 0) -> List[Dict[str, Any]]:
@@ -103,7 +181,7 @@ class SistemaApostasEsportivas:
         Returns:
             Lista de dicionários com informações dos jogos.
         """
-        logger.info(f"Coletando jogos para a data: {data} e {dias_futuros} dias futuros")
+        logger.info("Coletando jogos para a data: %s e %s dias futuros", data, dias_futuros)
         
         try:
             # Usar o coletor para obter jogos
@@ -111,7 +189,7 @@ class SistemaApostasEsportivas:
             return jogos
             
         except Exception as e:
-            logger.error(f"Erro ao coletar jogos: {str(e)}")
+            logger.error("Erro ao coletar jogos: %s", e)
             return []
     
     def coletar_estatisticas_jogos(self, jogos: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -124,7 +202,7 @@ class SistemaApostasEsportivas:
         Returns:
             Dicionário com estatísticas dos jogos, indexado pelo ID do jogo.
         """
-        logger.info(f"Coletando estatísticas para {len(jogos)} jogos")
+        logger.info("Coletando estatísticas para %s jogos", len(jogos))
         
         try:
             # Usar o coletor para obter estatísticas
@@ -132,7 +210,7 @@ class SistemaApostasEsportivas:
             return estatisticas
             
         except Exception as e:
-            logger.error(f"Erro ao coletar estatísticas: {str(e)}")
+            logger.error("Erro ao coletar estatísticas: %s", e)
             return {}
     
     def carregar_jogos(self) -> List[Dict[str, Any]]:
@@ -144,17 +222,79 @@ class SistemaApostasEsportivas:
         """
         return self.coletor.carregar_jogos()
     
+    def _obter_jogo(self, id_jogo: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um jogo salvo pelo ID em um índice em memória. Os jogos só são
+        recarregados quando o mtime do diretório de jogos muda (cada jogo é um
+        arquivo, então gravações e remoções alteram o diretório).
+        
+        Args:
+            id_jogo: ID único do jogo
+            
+        Returns:
+            Dicionário com informações do jogo, ou None se não encontrado.
+        """
+        try:
+            mtime = os.stat(self.coletor.diretorio_jogos).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if mtime is None or mtime != self._jogos_mtime:
+            # Percorrer em ordem inversa mantém o primeiro jogo de cada ID, como o next() anterior
+            self._jogos_por_id = {j['id_jogo']: j for j in reversed(self.carregar_jogos())}
+            self._jogos_mtime = mtime
+        
+        return self._jogos_por_id.get(id_jogo)
+    
     def carregar_estatisticas(self, id_jogo: str) -> Optional[Dict[str, Any]]:
         """
         Carrega estatísticas de um jogo salvo anteriormente.
         
+        Args:
+            id_jogo: ID único do jogo
+            
+        Returns:
+            Dicionário com estatísticas do jogo (uma cópia, que pode ser alterada
+            livremente), ou None se não encontrado.
+        """
+        return copy.deepcopy(self._estatisticas_em_cache(id_jogo))
+    
+    def _estatisticas_em_cache(self, id_jogo: str) -> Optional[Dict[str, Any]]:
+        """
+        Carrega estatísticas de um jogo pelo cache LRU, validado pelo mtime do arquivo.
+        
+        O dicionário devolvido é compartilhado com o cache e deve ser tratado como
+        somente leitura; quem precisar alterá-lo deve usar carregar_estatisticas.
+        
         Args:
             id_jogo: ID único do jogo
             
         Returns:
             Dicionário com estatísticas do jogo, ou None se não encontrado.
         """
-        return self.coletor.carregar_estatisticas(id_jogo)
+        arquivo = os.path.join(self.coletor.diretorio_estatisticas, f"{id_jogo}.json")
+        try:
+            mtime = os.stat(arquivo).st_mtime_ns
+        except OSError:
+            return self.coletor.carregar_estatisticas(id_jogo)
+        
+        with self._estatisticas_lock:
+            em_cache = self._estatisticas_cache.get(id_jogo)
+            if em_cache is not None and em_cache[0] == mtime:
+                self._estatisticas_cache.move_to_end(id_jogo)
+                return em_cache[1]
+        
+        # A leitura do disco fica fora da trava; duas threads podem ler o mesmo arquivo,
+        # e a última a terminar prevalece no cache
+        estatisticas = self.coletor.carregar_estatisticas(id_jogo)
+        if estatisticas is not None:
+            with self._estatisticas_lock:
+                self._estatisticas_cache[id_jogo] = (mtime, estatisticas)
+                self._estatisticas_cache.move_to_end(id_jogo)
+                if len(self._estatisticas_cache) > TAMANHO_CACHE_ESTATISTICAS:
+                    self._estatisticas_cache.popitem(last=False)
+        
+        return estatisticas
     
     def gerar_recomendacoes(self, id_jogo: str) -> Dict[str, Any]:
         """
@@ -166,24 +306,23 @@ class SistemaApostasEsportivas:
         Returns:
             Dicionário com recomendações de apostas.
         """
-        logger.info(f"Gerando recomendações para o jogo {id_jogo}")
+        logger.info("Gerando recomendações para o jogo %s", id_jogo)
         
-        # Carregar estatísticas do jogo
-        estatisticas = self.carregar_estatisticas(id_jogo)
+        # Carregar estatísticas do jogo (somente leitura)
+        estatisticas = self._estatisticas_em_cache(id_jogo)
         
         if not estatisticas:
-            logger.warning(f"Estatísticas não encontradas para o jogo {id_jogo}")
+            logger.warning("Estatísticas não encontradas para o jogo %s", id_jogo)
             return {
                 "erro": "Estatísticas não encontradas para este jogo",
                 "recomendacoes": {}
             }
         
-        # Carregar jogos para encontrar o jogo específico
-        jogos = self.carregar_jogos()
-        jogo = next((j for j in jogos if j['id_jogo'] == id_jogo), None)
+        # Buscar o jogo específico no índice de jogos
+        jogo = self._obter_jogo(id_jogo)
         
         if not jogo:
-            logger.warning(f"Jogo não encontrado: {id_jogo}")
+            logger.warning("Jogo não encontrado: %s", id_jogo)
             return {
                 "erro": "Jogo não encontrado",
                 "recomendacoes": {}
@@ -226,15 +365,18 @@ class SistemaApostasEsportivas:
             logger.warning("Informações insuficientes para gerar recomendações")
             return recomendacoes
         
-        # Calcular força relativa dos times
-        forca_casa = self._calcular_forca_time(time_casa)
-        forca_visitante = self._calcular_forca_time(time_visitante)
+        # Extrair as estatísticas de cada time uma única vez
+        features_casa = self._features_time(time_casa)
+        features_visitante = self._features_time(time_visitante)
+        jogos_casa = max(time_casa.get('jogos', 1), 1)
+        jogos_visitante = max(time_visitante.get('jogos', 1), 1)
         
-        # Calcular vantagem do mandante
-        vantagem_mandante = 1.2  # Fator de vantagem para o time da casa
+        # Calcular força relativa dos times
+        forca_casa = _forca_em_cache(*features_casa)
+        forca_visitante = _forca_em_cache(*features_visitante)
         
         # Ajustar força com vantagem do mandante
-        forca_casa_ajustada = forca_casa * vantagem_mandante
+        forca_casa_ajustada = forca_casa * VANTAGEM_MANDANTE
         
         # Calcular probabilidades
         prob_vitoria_casa = forca_casa_ajustada / (forca_casa_ajustada + forca_visitante)
@@ -256,11 +398,42 @@ class SistemaApostasEsportivas:
         ev_empate = (prob_empate * odds_empate) - 1
         ev_visitante = (prob_vitoria_visitante * odds_visitante) - 1
         
+        # Mercado de gols
+        media_gols_casa = features_casa[4] / jogos_casa
+        media_gols_visitante = features_visitante[4] / jogos_visitante
+        media_gols_total = media_gols_casa + media_gols_visitante
+        
+        odds_over = odds.get('over_under', {}).get('over_2_5', 0)
+        odds_under = odds.get('over_under', {}).get('under_2_5', 0)
+        
+        prob_over = 0.6 if media_gols_total > 2.5 else 0.4
+        prob_under = 1 - prob_over
+        
+        ev_over = (prob_over * odds_over) - 1
+        ev_under = (prob_under * odds_under) - 1
+        
+        # Mercado de ambas marcam
+        media_gols_sofridos_casa = features_casa[5] / jogos_casa
+        media_gols_sofridos_visitante = features_visitante[5] / jogos_visitante
+        
+        prob_ambas_marcam = min(1.0, (media_gols_casa * media_gols_sofridos_visitante + media_gols_visitante * media_gols_sofridos_casa) / 2)
+        prob_nao_ambas = 1 - prob_ambas_marcam
+        
+        odds_ambas_sim = odds.get('ambos_marcam', {}).get('sim', 0)
+        odds_ambas_nao = odds.get('ambos_marcam', {}).get('nao', 0)
+        
+        ev_ambas_sim = (prob_ambas_marcam * odds_ambas_sim) - 1
+        ev_ambas_nao = (prob_nao_ambas * odds_ambas_nao) - 1
+        
+        # Seleções de vitória, usadas nas três categorias de risco
+        selecao_vitoria_casa = f"Vitória {jogo['time_casa']}"
+        selecao_vitoria_visitante = f"Vitória {jogo['time_visitante']}"
+        
         # Gerar recomendações de baixo risco
         if prob_vitoria_casa > 0.6 and ev_casa > 0:
             recomendacoes["baixo_risco"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_casa']}",
+                "selecao": selecao_vitoria_casa,
                 "odd": odds_casa,
                 "confianca": round(prob_vitoria_casa * 100, 2),
                 "ev": round(ev_casa * 100, 2)
@@ -268,26 +441,12 @@ class SistemaApostasEsportivas:
         elif prob_vitoria_visitante > 0.6 and ev_visitante > 0:
             recomendacoes["baixo_risco"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_visitante']}",
+                "selecao": selecao_vitoria_visitante,
                 "odd": odds_visitante,
                 "confianca": round(prob_vitoria_visitante * 100, 2),
                 "ev": round(ev_visitante * 100, 2)
             })
         
-        # Verificar mercado de gols
-        media_gols_casa = time_casa.get('gols_marcados', 0) / max(time_casa.get('jogos', 1), 1)
-        media_gols_visitante = time_visitante.get('gols_marcados', 0) / max(time_visitante.get('jogos', 1), 1)
-        media_gols_total = media_gols_casa + media_gols_visitante
-        
-        odds_over = odds.get('over_under', {}).get('over_2_5', 0)
-        odds_under = odds.get('over_under', {}).get('under_2_5', 0)
-        
-        prob_over = 0.6 if media_gols_total > 2.5 else 0.4
-        prob_under = 1 - prob_over
-        
-        ev_over = (prob_over * odds_over) - 1
-        ev_under = (prob_under * odds_under) - 1
-        
         # Adicionar recomendação de gols
         if media_gols_total > 2.8 and ev_over > 0:
             recomendacoes["baixo_risco"].append({
@@ -310,7 +469,7 @@ class SistemaApostasEsportivas:
         if 0.45 < prob_vitoria_casa < 0.6 and ev_casa > 0.1:
             recomendacoes["moderado"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_casa']}",
+                "selecao": selecao_vitoria_casa,
                 "odd": odds_casa,
                 "confianca": round(prob_vitoria_casa * 100, 2),
                 "ev": round(ev_casa * 100, 2)
@@ -318,7 +477,7 @@ class SistemaApostasEsportivas:
         elif 0.45 < prob_vitoria_visitante < 0.6 and ev_visitante > 0.1:
             recomendacoes["moderado"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_visitante']}",
+                "selecao": selecao_vitoria_visitante,
                 "odd": odds_visitante,
                 "confianca": round(prob_vitoria_visitante * 100, 2),
                 "ev": round(ev_visitante * 100, 2)
@@ -333,18 +492,6 @@ class SistemaApostasEsportivas:
             })
         
         # Verificar mercado de ambas marcam
-        media_gols_sofridos_casa = time_casa.get('gols_sofridos', 0) / max(time_casa.get('jogos', 1), 1)
-        media_gols_sofridos_visitante = time_visitante.get('gols_sofridos', 0) / max(time_visitante.get('jogos', 1), 1)
-        
-        prob_ambas_marcam = min(1.0, (media_gols_casa * media_gols_sofridos_visitante + media_gols_visitante * media_gols_sofridos_casa) / 2)
-        prob_nao_ambas = 1 - prob_ambas_marcam
-        
-        odds_ambas_sim = odds.get('ambos_marcam', {}).get('sim', 0)
-        odds_ambas_nao = odds.get('ambos_marcam', {}).get('nao', 0)
-        
-        ev_ambas_sim = (prob_ambas_marcam * odds_ambas_sim) - 1
-        ev_ambas_nao = (prob_nao_ambas * odds_ambas_nao) - 1
-        
         if prob_ambas_marcam > 0.6 and ev_ambas_sim > 0:
             recomendacoes["moderado"].append({
                 "mercado": "Ambas Marcam",
@@ -366,7 +513,7 @@ class SistemaApostasEsportivas:
         if 0.3 < prob_vitoria_casa < 0.45 and odds_casa > 2.5:
             recomendacoes["alto_retorno"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_casa']}",
+                "selecao": selecao_vitoria_casa,
                 "odd": odds_casa,
                 "confianca": round(prob_vitoria_casa * 100, 2),
                 "ev": round(ev_casa * 100, 2)
@@ -374,7 +521,7 @@ class SistemaApostasEsportivas:
         elif 0.3 < prob_vitoria_visitante < 0.45 and odds_visitante > 2.5:
             recomendacoes["alto_retorno"].append({
                 "mercado": "Resultado Final",
-                "selecao": f"Vitória {jogo['time_visitante']}",
+                "selecao": selecao_vitoria_visitante,
                 "odd": odds_visitante,
                 "confianca": round(prob_vitoria_visitante * 100, 2),
                 "ev": round(ev_visitante * 100, 2)
@@ -403,37 +550,27 @@ class SistemaApostasEsportivas:
         Returns:
             Valor numérico representando a força do time
         """
-        # Extrair estatísticas relevantes
-        pontos = time_info.get('pontos', 0)
-        vitorias = time_info.get('vitorias', 0)
-        empates = time_info.get('empates', 0)
-        derrotas = time_info.get('derrotas', 0)
-        gols_marcados = time_info.get('gols_marcados', 0)
-        gols_sofridos = time_info.get('gols_sofridos', 0)
-        
-        # Calcular número de jogos
-        jogos = vitorias + empates + derrotas
-        
-        if jogos == 0:
-            return 1.0  # Valor padrão se não houver jogos
-        
-        # Calcular média de pontos por jogo
-        media_pontos = pontos / jogos
-        
-        # Calcular saldo de gols
-        saldo_gols = gols_marcados - gols_sofridos
-        
-        # Calcular média de gols marcados e sofridos
-        media_gols_marcados = gols_marcados / jogos
-        media_gols_sofridos = gols_sofridos / jogos if gols_sofridos > 0 else 0.5  # Evitar divisão por zero
-        
-        # Calcular força com base em pontos, saldo de gols e médias
-        forca = (media_pontos * 2) + (saldo_gols * 0.1) + (media_gols_marcados * 0.5) - (media_gols_sofridos * 0.3)
-        
-        # Ajustar para valor positivo
-        forca = max(0.5, forca)
+        return _forca_em_cache(*self._features_time(time_info))
+    
+    @staticmethod
+    def _features_time(time_info: Dict[str, Any]) -> Tuple[float, float, float, float, float, float]:
+        """
+        Extrai as estatísticas numéricas de um time usadas nos cálculos.
         
-        return forca
+        Args:
+            time_info: Dicionário com informações do time
+            
+        Returns:
+            Tupla (pontos, vitorias, empates, derrotas, gols_marcados, gols_sofridos)
+        """
+        return (
+            float(time_info.get('pontos', 0)),
+            float(time_info.get('vitorias', 0)),
+            float(time_info.get('empates', 0)),
+            float(time_info.get('derrotas', 0)),
+            float(time_info.get('gols_marcados', 0)),
+            float(time_info.get('gols_sofridos', 0))
+        )
     
     def _adicionar_recomendacoes_mercados_adicionais(self, recomendacoes: Dict[str, List[Dict[str, Any]]], 
                                                    jogo: Dict[str, Any], estatisticas: Dict[str, Any]) -> None:
@@ -505,7 +642,9 @@ class SistemaApostasEsportivas:
                     "ev": round((min(0.85, (6 - media_cartoes_total) / 6) * 2.0) - 1, 2) * 100
                 })
     
-    def gerar_estrategia_cashout(self, id_jogo: str, valor_aposta: float, odd_aposta: float) -> Dict[str, Any]:
+    def gerar_estrategia_cashout(self, id_jogo: str, valor_aposta: float, odd_aposta: float, *,
+                                 jogo: Optional[Dict[str, Any]] = None,
+                                 estatisticas: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Gera estratégia de cashout para uma aposta.
         
@@ -513,28 +652,31 @@ class SistemaApostasEsportivas:
             id_jogo: ID único do jogo
             valor_aposta: Valor da aposta
             odd_aposta: Odd da aposta
+            jogo: Jogo já carregado pelo chamador. Se None, é buscado pelo ID.
+            estatisticas: Estatísticas já carregadas pelo chamador. Se None, são carregadas pelo ID.
             
         Returns:
             Dicionário com estratégia de cashout.
         """
-        logger.info(f"Gerando estratégia de cashout para o jogo {id_jogo}")
+        logger.info("Gerando estratégia de cashout para o jogo %s", id_jogo)
         
         # Carregar estatísticas do jogo
-        estatisticas = self.carregar_estatisticas(id_jogo)
+        if estatisticas is None:
+            estatisticas = self._estatisticas_em_cache(id_jogo)
         
         if not estatisticas:
-            logger.warning(f"Estatísticas não encontradas para o jogo {id_jogo}")
+            logger.warning("Estatísticas não encontradas para o jogo %s", id_jogo)
             return {
                 "erro": "Estatísticas não encontradas para este jogo",
                 "estrategia": {}
             }
         
-        # Carregar jogos para encontrar o jogo específico
-        jogos = self.carregar_jogos()
-        jogo = next((j for j in jogos if j['id_jogo'] == id_jogo), None)
+        # Buscar o jogo específico no índice de jogos
+        if jogo is None:
+            jogo = self._obter_jogo(id_jogo)
         
         if not jogo:
-            logger.warning(f"Jogo não encontrado: {id_jogo}")
+            logger.warning("Jogo não encontrado: %s", id_jogo)
             return {
                 "erro": "Jogo não encontrado",
                 "estrategia": {}
@@ -582,54 +724,85 @@ class SistemaApostasEsportivas:
             "estrategia": estrategia
         }
     
-    def gerar_relatorio_json(self, id_jogo: str) -> str:
+    def _montar_relatorio(self, id_jogo: str) -> Dict[str, Any]:
         """
-        Gera relatório em formato JSON para um jogo.
+        Monta o relatório completo de um jogo, usado por gerar_relatorio_json e
+        escrever_relatorio_json.
         
         Args:
             id_jogo: ID único do jogo
             
         Returns:
-            String JSON com relatório completo.
+            Dicionário com o relatório, ou com a chave "erro" se faltarem dados.
         """
-        logger.info(f"Gerando relatório JSON para o jogo {id_jogo}")
-        
-        # Carregar estatísticas do jogo
-        estatisticas = self.carregar_estatisticas(id_jogo)
+        # Carregar estatísticas do jogo (somente leitura)
+        estatisticas = self._estatisticas_em_cache(id_jogo)
         
         if not estatisticas:
-            logger.warning(f"Estatísticas não encontradas para o jogo {id_jogo}")
-            return json.dumps({
+            logger.warning("Estatísticas não encontradas para o jogo %s", id_jogo)
+            return {
                 "erro": "Estatísticas não encontradas para este jogo",
                 "relatorio": {}
-            }, indent=2, ensure_ascii=False)
+            }
         
-        # Carregar jogos para encontrar o jogo específico
-        jogos = self.carregar_jogos()
-        jogo = next((j for j in jogos if j['id_jogo'] == id_jogo), None)
+        # Buscar o jogo específico no índice de jogos
+        jogo = self._obter_jogo(id_jogo)
         
         if not jogo:
-            logger.warning(f"Jogo não encontrado: {id_jogo}")
-            return json.dumps({
+            logger.warning("Jogo não encontrado: %s", id_jogo)
+            return {
                 "erro": "Jogo não encontrado",
                 "relatorio": {}
-            }, indent=2, ensure_ascii=False)
+            }
         
         # Gerar recomendações
         recomendacoes = self._calcular_recomendacoes(jogo, estatisticas)
         
         # Gerar estratégia de cashout (exemplo com valores padrão)
-        estrategia_cashout = self.gerar_estrategia_cashout(id_jogo, 100.0, 2.0)
+        estrategia_cashout = self.gerar_estrategia_cashout(id_jogo, 100.0, 2.0, jogo=jogo, estatisticas=estatisticas)
         
         # Construir relatório completo
-        relatorio = {
+        return {
             "jogo": jogo,
             "estatisticas": estatisticas,
             "recomendacoes": recomendacoes,
             "estrategia_cashout": estrategia_cashout.get("estrategia", {})
         }
+    
+    def gerar_relatorio_json(self, id_jogo: str, compacto: bool = False) -> str:
+        """
+        Gera relatório em formato JSON para um jogo.
         
-        return json.dumps(relatorio, indent=2, ensure_ascii=False)
+        Args:
+            id_jogo: ID único do jogo
+            compacto: Se True, gera JSON sem indentação nem espaços.
+            
+        Returns:
+            String JSON com relatório completo.
+        """
+        logger.info("Gerando relatório JSON para o jogo %s", id_jogo)
+        
+        return _serializar_relatorio(self._montar_relatorio(id_jogo), compacto)
+    
+    def escrever_relatorio_json(self, id_jogo: str, arquivo: TextIO, compacto: bool = False) -> None:
+        """
+        Gera o relatório em JSON de um jogo e o escreve diretamente em um arquivo,
+        sem montar antes a string completa em memória.
+        
+        Args:
+            id_jogo: ID único do jogo
+            arquivo: Arquivo de texto aberto para escrita
+            compacto: Se True, gera JSON sem indentação nem espaços.
+        """
+        logger.info("Escrevendo relatório JSON para o jogo %s", id_jogo)
+        
+        relatorio = self._montar_relatorio(id_jogo)
+        
+        # orjson serializa tudo de uma vez em C; sem ele, o json.dump escreve por partes
+        if orjson is not None:
+            arquivo.write(_serializar_relatorio(relatorio, compacto))
+        else:
+            json.dump(relatorio, arquivo, ensure_ascii=False, **_opcoes_json(compacto))
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -687,10 +860,6 @@ if __name__ == "__main__":
     if jogos:
         # Gerar relatório para o primeiro jogo
         id_jogo = jogos[0]['id_jogo']
-        relatorio = sistema.gerar_relatorio_json(id_jogo)
-        print(f"Relatório gerado para o jogo {id_jogo}")
-        
-        # Salvar relatório em arquivo
-        with open(f"relatorio_{id_jogo}.json", "w", encoding="utf-8") as f:
-            f.write(relatorio)
-            print(f"Relatório salvo em relatorio_{id_jogo}.json")
+        with open(f"relatorio_{id_jogo}.json", "w", encoding="utf-8", buffering=1024 * 1024) as f:
+            sistema.escrever_relatorio_json(id_jogo, f)
+        print(f"Relatório salvo em relatorio_{id_jogo}.json")
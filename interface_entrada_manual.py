@@ -6,15 +6,26 @@ do site Academia das Apostas Brasil.
 """
 
 import os
+import copy
 import json
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from flask import (Flask, render_template, stream_template, request, redirect, url_for, flash,
+                   get_flashed_messages, session, Response)
 from flask_wtf import FlaskForm
 from wtforms import TextAreaField, SubmitField, StringField, SelectField
 from wtforms.validators import DataRequired
 
 from coleta_dados_reais import ColetorDadosReais
 
+# orjson é opcional: sem ele, as APIs serializam com o json da biblioteca padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +36,112 @@ logger = logging.getLogger('interface_entrada_manual')
 # Inicializar o coletor de dados
 coletor = ColetorDadosReais()
 
+# Gravações em disco feitas fora da requisição, indexadas pelo ID do jogo. Ficam no índice
+# enquanto pendentes e, se falharem, até o erro ser mostrado na página de estatísticas
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gravacao')
+_gravacoes_pendentes = {}
+_trava_gravacoes = threading.Lock()
+
+def _gravar_jogo_em_segundo_plano(jogo, estatisticas):
+    """Agenda a gravação das estatísticas e do jogo sem bloquear a requisição."""
+    id_jogo = jogo['id_jogo']
+    
+    def gravar():
+        coletor._salvar_estatisticas(id_jogo, estatisticas)
+        coletor._salvar_jogos([jogo])
+    
+    def concluir(futuro):
+        erro = futuro.exception()
+        if erro is not None:
+            logger.error(f"Erro ao salvar o jogo {id_jogo}: {str(erro)}")
+            return
+        with _trava_gravacoes:
+            # Uma gravação mais recente do mesmo jogo pode já ter substituído esta
+            if _gravacoes_pendentes.get(id_jogo) is futuro:
+                del _gravacoes_pendentes[id_jogo]
+    
+    futuro = _io_pool.submit(gravar)
+    with _trava_gravacoes:
+        _gravacoes_pendentes[id_jogo] = futuro
+    # Registrado fora da trava: se a gravação já terminou, concluir roda nesta thread
+    futuro.add_done_callback(concluir)
+
+def _aguardar_gravacao(id_jogo, descartar_erro=False):
+    """Espera a gravação pendente de um jogo, se houver, e retorna o erro dela (ou None)."""
+    with _trava_gravacoes:
+        futuro = _gravacoes_pendentes.get(id_jogo)
+    if futuro is None:
+        return None
+    
+    erro = futuro.exception()
+    if erro is not None and descartar_erro:
+        with _trava_gravacoes:
+            if _gravacoes_pendentes.get(id_jogo) is futuro:
+                del _gravacoes_pendentes[id_jogo]
+    return erro
+
+# Cache dos jogos salvos, invalidado pelo mtime do diretório de jogos (cada jogo é um
+# arquivo, então gravações e remoções alteram o diretório). A trava mantém mtime, lista,
+# índice e JSON serializado sempre da mesma versão; os jogos em cache são somente leitura
+_cache_jogos = {'mtime': None, 'jogos': [], 'por_id': {}, 'json': None}
+_trava_jogos = threading.Lock()
+
+def _estado_jogos():
+    """Retorna uma cópia do estado do cache de jogos, relendo o disco se o diretório mudou; None se não há diretório."""
+    try:
+        mtime = os.stat(coletor.diretorio_jogos).st_mtime_ns
+    except OSError:
+        return None
+    
+    with _trava_jogos:
+        if _cache_jogos['mtime'] != mtime:
+            jogos = coletor.carregar_jogos()
+            # Em ordem inversa, o primeiro jogo de cada ID prevalece no índice
+            _cache_jogos.update(mtime=mtime, jogos=jogos, por_id={j['id_jogo']: j for j in reversed(jogos)}, json=None)
+        return dict(_cache_jogos)
+
+def _carregar_jogos():
+    """Carrega os jogos salvos (somente leitura), relendo o disco apenas quando o diretório de jogos muda."""
+    estado = _estado_jogos()
+    if estado is None:
+        return coletor.carregar_jogos()
+    return estado['jogos']
+
+def _obter_jogo(id_jogo):
+    """Busca um jogo salvo pelo ID no índice em memória (somente leitura)."""
+    _aguardar_gravacao(id_jogo)
+    estado = _estado_jogos()
+    if estado is None:
+        return next((j for j in coletor.carregar_jogos() if j['id_jogo'] == id_jogo), None)
+    return estado['por_id'].get(id_jogo)
+
+@lru_cache(maxsize=256)
+def _carregar_estatisticas_versao(id_jogo, mtime):
+    """Carrega as estatísticas de um jogo; o mtime do arquivo faz parte da chave do cache."""
+    return coletor.carregar_estatisticas(id_jogo)
+
+def _carregar_estatisticas(id_jogo):
+    """Carrega as estatísticas de um jogo, relendo o disco apenas quando o arquivo muda."""
+    _aguardar_gravacao(id_jogo)
+    arquivo = os.path.join(coletor.diretorio_estatisticas, f"{id_jogo}.json")
+    try:
+        mtime = os.stat(arquivo).st_mtime_ns
+    except OSError:
+        return coletor.carregar_estatisticas(id_jogo)
+    
+    # Cópia: o objeto em cache é compartilhado entre requisições
+    return copy.deepcopy(_carregar_estatisticas_versao(id_jogo, mtime))
+
+def _dados_json(obj):
+    """Serializa um objeto em bytes JSON compactos, com chaves ordenadas como no jsonify."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def _ojson(obj, status=200):
+    """Gera uma resposta JSON, serializada com orjson quando disponível."""
+    return Response(_dados_json(obj), status=status, mimetype='application/json')
+
 # Definir formulários
 class FormEntradaManual(FlaskForm):
     """Formulário para entrada manual de dados copiados."""
@@ -48,6 +165,13 @@ def criar_app():
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'sistema-apostas-esportivas-entrada-manual'
     
+    def transmitir_template(nome, **contexto):
+        # Páginas com tabelas grandes são enviadas em partes, à medida que o Jinja as
+        # renderiza. As mensagens flash são lidas antes: o cookie de sessão é gravado
+        # junto com os cabeçalhos, então retirá-las durante o streaming não teria efeito
+        get_flashed_messages()
+        return app.response_class(stream_template(nome, **contexto))
+    
     # Rota principal - formulário de entrada manual
     @app.route('/', methods=['GET', 'POST'])
     def index():
@@ -80,7 +204,7 @@ def criar_app():
                 flash(f'Erro ao processar o texto: {str(e)}', 'danger')
         
         # Carregar jogos disponíveis
-        jogos = coletor.carregar_jogos()
+        jogos = _carregar_jogos()
         
         return render_template('entrada_manual.html', form=form, jogos=jogos)
     
@@ -88,14 +212,14 @@ def criar_app():
     @app.route('/resultados/<tipo>')
     def resultados(tipo):
         # Carregar jogos disponíveis
-        jogos = coletor.carregar_jogos()
+        jogos = _carregar_jogos()
         
         # Carregar estatísticas para o primeiro jogo (se houver)
         estatisticas = None
         if jogos:
-            estatisticas = coletor.carregar_estatisticas(jogos[0]['id_jogo'])
+            estatisticas = _carregar_estatisticas(jogos[0]['id_jogo'])
         
-        return render_template('resultados.html', tipo=tipo, jogos=jogos, estatisticas=estatisticas)
+        return transmitir_template('resultados.html', tipo=tipo, jogos=jogos, estatisticas=estatisticas)
     
     # Rota para buscar jogo específico
     @app.route('/buscar-jogo', methods=['GET', 'POST'])
@@ -113,9 +237,6 @@ def criar_app():
                 # Gerar ID para o jogo
                 id_jogo = f"{time_casa.lower().replace(' ', '_')}_{time_visitante.lower().replace(' ', '_')}_manual"
                 
-                # Salvar estatísticas
-                coletor._salvar_estatisticas(id_jogo, estatisticas)
-                
                 # Criar jogo
                 jogo = {
                     'id_jogo': id_jogo,
@@ -126,10 +247,10 @@ def criar_app():
                     'campeonato': 'Brasileirão Série A'
                 }
                 
-                # Salvar jogo
-                coletor._salvar_jogos([jogo])
-                
-                flash(f'Estatísticas para {time_casa} vs {time_visitante} coletadas com sucesso!', 'success')
+                # Salvar estatísticas e jogo em segundo plano; a página de estatísticas
+                # aguarda a gravação e só então mostra o sucesso ou o erro dela
+                _gravar_jogo_em_segundo_plano(jogo, estatisticas)
+                session['jogo_coletado'] = [id_jogo, f'Estatísticas para {time_casa} vs {time_visitante} coletadas com sucesso!']
                 return redirect(url_for('visualizar_estatisticas', id_jogo=id_jogo))
                 
             except Exception as e:
@@ -141,50 +262,79 @@ def criar_app():
     # Rota para visualizar estatísticas de um jogo
     @app.route('/estatisticas/<id_jogo>')
     def visualizar_estatisticas(id_jogo):
+        # Resultado da gravação em segundo plano iniciada por buscar_jogo
+        coletado = session.pop('jogo_coletado', None)
+        erro = _aguardar_gravacao(id_jogo, descartar_erro=True)
+        if erro is not None:
+            logger.error(f"Erro ao buscar estatísticas: {str(erro)}")
+            flash(f'Erro ao buscar estatísticas: {str(erro)}', 'danger')
+            return redirect(url_for('buscar_jogo'))
+        if coletado and coletado[0] == id_jogo:
+            flash(coletado[1], 'success')
+        
         # Carregar estatísticas do jogo
-        estatisticas = coletor.carregar_estatisticas(id_jogo)
+        estatisticas = _carregar_estatisticas(id_jogo)
         
         if not estatisticas:
             flash(f'Estatísticas não encontradas para o jogo {id_jogo}', 'warning')
             return redirect(url_for('index'))
         
-        # Carregar jogos para encontrar o jogo específico
-        jogos = coletor.carregar_jogos()
-        jogo = next((j for j in jogos if j['id_jogo'] == id_jogo), None)
+        # Buscar o jogo específico no índice de jogos
+        jogo = _obter_jogo(id_jogo)
         
-        return render_template('visualizar_estatisticas.html', jogo=jogo, estatisticas=estatisticas)
+        return transmitir_template('visualizar_estatisticas.html', jogo=jogo, estatisticas=estatisticas)
     
     # API para obter jogos disponíveis
     @app.route('/api/jogos')
     def api_jogos():
-        jogos = coletor.carregar_jogos()
-        return jsonify({"jogos": jogos})
+        estado = _estado_jogos()
+        if estado is None:
+            return _ojson({"jogos": coletor.carregar_jogos()})
+        
+        # O mtime do diretório de jogos identifica a versão da lista: clientes que já a
+        # têm recebem 304, e o corpo serializado é reaproveitado até o diretório mudar.
+        # ETag e corpo vêm da mesma cópia do estado, então são sempre da mesma versão
+        etag = str(estado['mtime'])
+        if request.if_none_match.contains_weak(etag):
+            resposta = Response(status=304)
+        else:
+            corpo = estado['json']
+            if corpo is None:
+                corpo = _dados_json({"jogos": estado['jogos']})
+                with _trava_jogos:
+                    if _cache_jogos['mtime'] == estado['mtime']:
+                        _cache_jogos['json'] = corpo
+            resposta = Response(corpo, mimetype='application/json')
+        
+        resposta.set_etag(etag, weak=True)
+        resposta.headers['Cache-Control'] = 'private, max-age=5'
+        return resposta
     
     # API para obter estatísticas de um jogo
     @app.route('/api/estatisticas/<id_jogo>')
     def api_estatisticas(id_jogo):
-        estatisticas = coletor.carregar_estatisticas(id_jogo)
+        estatisticas = _carregar_estatisticas(id_jogo)
         
         if not estatisticas:
-            return jsonify({"erro": "Estatísticas não encontradas"}), 404
+            return _ojson({"erro": "Estatísticas não encontradas"}, 404)
             
-        return jsonify(estatisticas)
+        return _ojson(estatisticas)
     
     # API para processar texto copiado
     @app.route('/api/processar-texto', methods=['POST'])
     def api_processar_texto():
         if not request.json or 'texto' not in request.json:
-            return jsonify({"erro": "Texto não fornecido"}), 400
+            return _ojson({"erro": "Texto não fornecido"}, 400)
             
         texto = request.json['texto']
         
         try:
             resultado = coletor.processar_texto_copiado(texto)
-            return jsonify(resultado)
+            return _ojson(resultado)
             
         except Exception as e:
             logger.error(f"Erro ao processar texto copiado: {str(e)}")
-            return jsonify({"erro": str(e)}), 500
+            return _ojson({"erro": str(e)}, 500)
     
     return app
 
@@ -40,6 +40,19 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             'ultimos_jogos': re.compile(r'ÚLTIMOS \d+ JOGOS'),
             'escanteios': re.compile(r'Escanteios'),
             'cartoes': re.compile(r'Cartões'),
+            'quebras_linha': re.compile(r'[\r\n]+'),
+            'espacos': re.compile(r' +'),
+            'pagina_jogo': re.compile(r'Quem será o vencedor\?|CONFRONTO DIRETO', re.IGNORECASE),
+            'pagina_lista': re.compile(r'JOGOS DISPONÍVEIS|FUTEBOL HOJE', re.IGNORECASE),
+            'pagina_tabela': re.compile(r'CLASSIFICAÇÕES?|TABELA', re.IGNORECASE),
+            'vs': re.compile(r'vs', re.IGNORECASE),
+            'confrontos_total': re.compile(r'CONFRONTO DIRETO.*?(\d+)\s+jogo', re.IGNORECASE | re.DOTALL),
+            'confrontos_empates': re.compile(r'Empates.*?(\d+)', re.IGNORECASE | re.DOTALL),
+            'confronto': re.compile(r'(\d{2}/\d{2}/\d{4}).*?(\w+)\s+(\d+)-(\d+)\s+(\w+).*?([\w\s]+)', re.IGNORECASE | re.DOTALL),
+            'odds_alternativas': re.compile(r'(\d+\.\d+)\s+(\d+\.\d+)\s+(\d+\.\d+)'),
+            'over_under': re.compile(r'Over\s+(\d+\.\d+).*?Under\s+(\d+\.\d+)', re.IGNORECASE | re.DOTALL),
+            'ambos_marcam': re.compile(r'Sim\s+(\d+\.\d+).*?Não\s+(\d+\.\d+)', re.IGNORECASE | re.DOTALL),
+            'resultado_ultimo_jogo': re.compile(r'[VED]', re.IGNORECASE),
         }
     
     def processar_texto(self, texto: str) -> Dict[str, Any]:
@@ -83,9 +96,8 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             Texto normalizado
         """
         # Remover caracteres especiais
-        texto = re.sub(r'[\r\n]+', '\n', texto)
-        texto = re.sub(r'\t+', ' ', texto)
-        texto = re.sub(r' +', ' ', texto)
+        texto = self.padroes['quebras_linha'].sub('\n', texto)
+        texto = self.padroes['espacos'].sub(' ', texto.replace('\t', ' '))
         
         # Remover espaços no início e fim de cada linha
         linhas = [linha.strip() for linha in texto.split('\n')]
@@ -104,24 +116,23 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             Tipo de conteúdo: 'jogo_especifico', 'lista_jogos', 'tabela_classificacao' ou 'desconhecido'
         """
         # Verificar se é uma página de jogo específico
-        if re.search(r'Quem será o vencedor\?', texto, re.IGNORECASE) or \
-           re.search(r'CONFRONTO DIRETO', texto, re.IGNORECASE):
+        if self.padroes['pagina_jogo'].search(texto):
             return 'jogo_especifico'
         
         # Verificar se é uma lista de jogos
-        if re.search(r'JOGOS DISPONÍVEIS|FUTEBOL HOJE', texto, re.IGNORECASE) and \
-           len(re.findall(r'vs', texto, re.IGNORECASE)) > 3:
+        if self.padroes['pagina_lista'].search(texto) and \
+           len(self.padroes['vs'].findall(texto)) > 3:
             return 'lista_jogos'
         
         # Verificar se é uma tabela de classificação
-        if re.search(r'CLASSIFICAÇÕES?|TABELA', texto, re.IGNORECASE) and \
-           re.search(self.padroes['tabela_inicio'], texto):
+        if self.padroes['pagina_tabela'].search(texto) and \
+           self.padroes['tabela_inicio'].search(texto):
             return 'tabela_classificacao'
         
         # Verificar se contém pelo menos um jogo
-        if re.search(self.padroes['jogo'], texto) and re.search(self.padroes['data_hora'], texto):
+        if self.padroes['jogo'].search(texto) and self.padroes['data_hora'].search(texto):
             # Se tiver poucas ocorrências de "vs", provavelmente é um jogo específico
-            if len(re.findall(r'vs', texto, re.IGNORECASE)) <= 3:
+            if len(self.padroes['vs'].findall(texto)) <= 3:
                 return 'jogo_especifico'
             else:
                 return 'lista_jogos'
@@ -407,7 +418,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             Dicionário com informações sobre confrontos diretos
         """
         # Procurar seção de confrontos diretos
-        match_confrontos = re.search(r'CONFRONTO DIRETO.*?(\d+)\s+jogo', texto, re.IGNORECASE | re.DOTALL)
+        match_confrontos = self.padroes['confrontos_total'].search(texto)
         
         if not match_confrontos:
             return {
@@ -425,7 +436,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
         
         # Extrair vitórias, empates e derrotas
         padrao_vitorias_casa = re.compile(rf'Vitórias\s+{time_casa}.*?(\d+)', re.IGNORECASE | re.DOTALL)
-        padrao_empates = re.compile(r'Empates.*?(\d+)', re.IGNORECASE | re.DOTALL)
+        padrao_empates = self.padroes['confrontos_empates']
         padrao_vitorias_visitante = re.compile(rf'Vitórias\s+{time_visitante}.*?(\d+)', re.IGNORECASE | re.DOTALL)
         
         vitorias_casa = self._extrair_valor_numerico(texto, padrao_vitorias_casa, 0)
@@ -436,7 +447,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
         confrontos = []
         
         # Padrão para extrair confrontos
-        padrao_confronto = re.compile(r'(\d{2}/\d{2}/\d{4}).*?(\w+)\s+(\d+)-(\d+)\s+(\w+).*?([\w\s]+)', re.IGNORECASE | re.DOTALL)
+        padrao_confronto = self.padroes['confronto']
         
         # Procurar todos os confrontos
         for match in padrao_confronto.finditer(texto):
@@ -486,7 +497,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             visitante = float(match_odds.group(3))
         else:
             # Tentar outro padrão
-            padrao_alternativo = re.compile(r'(\d+\.\d+)\s+(\d+\.\d+)\s+(\d+\.\d+)')
+            padrao_alternativo = self.padroes['odds_alternativas']
             match_alternativo = padrao_alternativo.search(texto)
             
             if match_alternativo:
@@ -499,7 +510,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
                 visitante = 0.0
         
         # Extrair odds de over/under
-        padrao_over_under = re.compile(r'Over\s+(\d+\.\d+).*?Under\s+(\d+\.\d+)', re.IGNORECASE | re.DOTALL)
+        padrao_over_under = self.padroes['over_under']
         match_over_under = padrao_over_under.search(texto)
         
         if match_over_under:
@@ -510,7 +521,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
             under_2_5 = 0.0
         
         # Extrair odds de ambas marcam
-        padrao_ambos_marcam = re.compile(r'Sim\s+(\d+\.\d+).*?Não\s+(\d+\.\d+)', re.IGNORECASE | re.DOTALL)
+        padrao_ambos_marcam = self.padroes['ambos_marcam']
         match_ambos_marcam = padrao_ambos_marcam.search(texto)
         
         if match_ambos_marcam:
@@ -637,7 +648,7 @@ class ProcessadorTextoCopiadoAcademiaApostas:
         
         # Extrair resultados
         resultados_texto = match_ultimos_jogos.group(1)
-        resultados = re.findall(r'[VED]', resultados_texto, re.IGNORECASE)
+        resultados = self.padroes['resultado_ultimo_jogo'].findall(resultados_texto)
         
         # Limitar a 5 resultados
         return resultados[:5]